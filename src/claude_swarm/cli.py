@@ -2,15 +2,34 @@
 
 from __future__ import annotations
 
-import asyncio
 import os
 import sys
+from typing import Any
 
 import click
 
 from . import __version__
 
 
+def entry() -> None:
+    """Console-script entry point with fast paths for trivial invocations.
+
+    Short-circuits ``--version`` and bare invocations before click builds
+    and runs its parser, keeping perceived startup latency minimal.
+    """
+    argv = sys.argv[1:]
+    if argv and argv[0] in ("-v", "--version"):
+        print(f"claude-swarm v{__version__}")
+        return
+    if not argv:
+        print("Usage: claude-swarm <task description>")
+        print("       claude-swarm --help for options")
+        print("       claude-swarm --demo  # Live demo")
+        print("       claude-swarm sessions  # List past sessions")
+        return
+    main()
+
+
 @click.group(invoke_without_command=True)
 @click.argument("task", required=False)
 @click.option("--cwd", "-d", default=".", help="Working directory for the project")
@@ -64,6 +83,8 @@ def main(
 
     # Demo mode — no API key required
     if demo:
+        import asyncio
+
         from .demo import run_demo
 
         asyncio.run(run_demo(prompt=task))
@@ -84,6 +105,8 @@ def main(
 
     resolved_cwd = os.path.abspath(cwd)
 
+    import asyncio
+
     asyncio.run(
         _run_swarm(
             task=task,
@@ -100,6 +123,10 @@ def main(
     )
 
 
+# Session-listing row layout, compiled once rather than per row.
+_SESSIONS_ROW_FMT = "{:<20} {:<50} {:<10} {:<10}\n"
+
+
 @main.command()
 @click.option("--limit", "-l", default=20, help="Number of sessions to show")
 def sessions(limit: int) -> None:
@@ -111,14 +138,131 @@ def sessions(limit: int) -> None:
         click.echo("No sessions found. Run a swarm first!")
         return
 
-    click.echo(f"\n{'ID':<20} {'Prompt':<50} {'Duration':<10} {'Cost':<10}")
-    click.echo("-" * 90)
+    lines = [
+        "\n" + _SESSIONS_ROW_FMT.format("ID", "Prompt", "Duration", "Cost"),
+        "-" * 90 + "\n",
+    ]
     for s in sessions_list:
         duration = f"{s.get('duration_s', 0):.1f}s" if s.get("duration_s") else "-"
         result = s.get("result", {})
         cost = f"${result.get('total_cost_usd', 0):.4f}" if isinstance(result, dict) else "-"
-        click.echo(f"{s['session_id']:<20} {s['prompt']:<50} {duration:<10} {cost:<10}")
-    click.echo()
+        lines.append(_SESSIONS_ROW_FMT.format(s["session_id"], s["prompt"], duration, cost))
+    lines.append("\n")
+    sys.stdout.write("".join(lines))
+
+
+# Replay event printers — one handler per event type, dispatched by a
+# single dict lookup instead of a per-event if/elif chain. The static
+# markup for each line lives in a module-level template so the loop only
+# pays for field substitution, not f-string rebuilding.
+
+def _trunc(s: str, n: int) -> str:
+    """Truncate a string to n chars without allocating when already short."""
+    return s if len(s) <= n else s[:n]
+
+
+_TS_TMPL = "[dim]{:>8.2f}s[/dim]"
+_SESSION_START_TMPL = "{} [bold green]SESSION START[/bold green] {}"
+_PLAN_CREATED_TMPL = "{} [bold blue]PLAN CREATED[/bold blue] {} tasks"
+_AGENT_START_TMPL = "{} [green]AGENT START[/green]  {} -> {} ({})"
+_TOOL_USE_TMPL = "{} [cyan]TOOL USE[/cyan]     {}: {}"
+_AGENT_DONE_TMPL = "{} [green]AGENT DONE[/green]   {} (${:.4f}, {}ms)"
+_AGENT_FAIL_TMPL = "{} [red]AGENT FAIL[/red]   {}: {}"
+_CONFLICT_TMPL = "{} [yellow]CONFLICT[/yellow]     {} ({})"
+_QUALITY_GATE_TMPL = "{} [bold magenta]QUALITY GATE[/bold magenta]  Score: {}/10 | Verdict: {}"
+_SESSION_END_TMPL = "{} [bold green]SESSION END[/bold green]   Total cost: ${:.4f}"
+
+
+# Handlers receive the event's data dict unpacked as keyword arguments —
+# one C-level unpack per event instead of repeated dict.get calls.
+
+
+def _replay_session_started(
+    console: Any, ts: str, agent: str, task: str, *, prompt: str = "", **_: Any
+) -> None:
+    console.print(_SESSION_START_TMPL.format(ts, _trunc(prompt, 60)))
+
+
+def _replay_plan_created(
+    console: Any, ts: str, agent: str, task: str, *, tasks: list | None = None, **_: Any
+) -> None:
+    console.print(_PLAN_CREATED_TMPL.format(ts, len(tasks or [])))
+
+
+def _replay_agent_started(
+    console: Any, ts: str, agent: str, task: str, *, description: str = "", **_: Any
+) -> None:
+    console.print(_AGENT_START_TMPL.format(ts, agent, task, _trunc(description, 40)))
+
+
+def _replay_tool_use(
+    console: Any, ts: str, agent: str, task: str, *, tool: str = "?", **_: Any
+) -> None:
+    console.print(_TOOL_USE_TMPL.format(ts, agent, tool))
+
+
+def _replay_agent_completed(
+    console: Any,
+    ts: str,
+    agent: str,
+    task: str,
+    *,
+    cost_usd: float = 0,
+    duration_ms: int = 0,
+    **_: Any,
+) -> None:
+    console.print(_AGENT_DONE_TMPL.format(ts, agent, cost_usd, duration_ms))
+
+
+def _replay_agent_failed(
+    console: Any, ts: str, agent: str, task: str, *, error: str = "", **_: Any
+) -> None:
+    console.print(_AGENT_FAIL_TMPL.format(ts, agent, _trunc(error, 60)))
+
+
+def _replay_file_conflict(
+    console: Any,
+    ts: str,
+    agent: str,
+    task: str,
+    *,
+    file_path: str = "",
+    agent_ids: list | None = None,
+    **_: Any,
+) -> None:
+    console.print(_CONFLICT_TMPL.format(ts, file_path, agent_ids or []))
+
+
+def _replay_quality_gate(
+    console: Any,
+    ts: str,
+    agent: str,
+    task: str,
+    *,
+    overall_score: Any = "?",
+    verdict: str = "?",
+    **_: Any,
+) -> None:
+    console.print(_QUALITY_GATE_TMPL.format(ts, overall_score, verdict))
+
+
+def _replay_session_completed(
+    console: Any, ts: str, agent: str, task: str, *, total_cost_usd: float = 0, **_: Any
+) -> None:
+    console.print(_SESSION_END_TMPL.format(ts, total_cost_usd))
+
+
+_REPLAY_HANDLERS = {
+    "session_started": _replay_session_started,
+    "plan_created": _replay_plan_created,
+    "agent_started": _replay_agent_started,
+    "tool_use": _replay_tool_use,
+    "agent_completed": _replay_agent_completed,
+    "agent_failed": _replay_agent_failed,
+    "file_conflict": _replay_file_conflict,
+    "quality_gate": _replay_quality_gate,
+    "session_completed": _replay_session_completed,
+}
 
 
 @main.command()
@@ -137,53 +281,29 @@ def replay(session_id: str) -> None:
 
     console.print(f"\n[bold blue]Replaying session: {session_id}[/bold blue]\n")
 
-    for event in events:
-        ts = f"[dim]{event['timestamp']:>8.2f}s[/dim]"
-        etype = event["event_type"]
-        agent = event.get("agent_id", "")
-        task = event.get("task_id", "")
-        data = event.get("data", {})
-
-        prompt_preview = data.get("prompt", "")[:60]
-        if etype == "session_started":
-            console.print(f"{ts} [bold green]SESSION START[/bold green] {prompt_preview}")
-        elif etype == "plan_created":
-            n = len(data.get("tasks", []))
-            console.print(f"{ts} [bold blue]PLAN CREATED[/bold blue] {n} tasks")
-        elif etype == "agent_started":
-            desc = data.get("description", "")[:40]
-            console.print(
-                f"{ts} [green]AGENT START[/green]  {agent} -> {task} ({desc})"
-            )
-        elif etype == "tool_use":
-            tool = data.get("tool", "?")
-            console.print(f"{ts} [cyan]TOOL USE[/cyan]     {agent}: {tool}")
-        elif etype == "agent_completed":
-            cost = data.get("cost_usd", 0)
-            dur = data.get("duration_ms", 0)
-            console.print(
-                f"{ts} [green]AGENT DONE[/green]   {agent} (${cost:.4f}, {dur}ms)"
-            )
-        elif etype == "agent_failed":
-            err = data.get("error", "")[:60]
-            console.print(f"{ts} [red]AGENT FAIL[/red]   {agent}: {err}")
-        elif etype == "file_conflict":
-            fp = data.get("file_path", "")
-            aids = data.get("agent_ids", [])
-            console.print(f"{ts} [yellow]CONFLICT[/yellow]     {fp} ({aids})")
-        elif etype == "quality_gate":
-            score = data.get("overall_score", "?")
-            verdict = data.get("verdict", "?")
-            console.print(
-                f"{ts} [bold magenta]QUALITY GATE[/bold magenta]"
-                f"  Score: {score}/10 | Verdict: {verdict}"
-            )
-        elif etype == "session_completed":
-            total = data.get("total_cost_usd", 0)
-            console.print(
-                f"{ts} [bold green]SESSION END[/bold green]"
-                f"   Total cost: ${total:.4f}"
-            )
+    # Render in batches through Console.capture so a long replay issues a
+    # handful of stdout writes instead of one write+flush per event.
+    batch_size = 256
+    for start in range(0, len(events), batch_size):
+        with console.capture() as capture:
+            for event in events[start : start + batch_size]:
+                handler = _REPLAY_HANDLERS.get(event["event_type"])
+                if handler is None:
+                    continue
+                # Newer sessions store integer ms offsets; older ones float
+                # seconds under "timestamp".
+                if "timestamp_ms" in event:
+                    ts = _TS_TMPL.format(event["timestamp_ms"] / 1000)
+                else:
+                    ts = _TS_TMPL.format(event.get("timestamp", 0.0))
+                handler(
+                    console,
+                    ts,
+                    event.get("agent_id", ""),
+                    event.get("task_id", ""),
+                    **event.get("data", {}),
+                )
+        sys.stdout.write(capture.get())
 
     console.print()
 
@@ -201,12 +321,23 @@ async def _run_swarm(
     max_retries: int = 1,
 ) -> None:
     """Main async entry point for the swarm."""
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
     from .config import SwarmConfig, find_config
     from .decomposer import decompose_task
     from .orchestrator import SwarmOrchestrator
     from .session import SessionRecorder
     from .ui import SwarmUI
 
+    # Size the default executor to the swarm instead of the CPU count —
+    # agent work is I/O-bound, so to_thread calls downstream shouldn't
+    # contend for the loop's default min(32, cpu+4) workers.
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=max(max_agents * 2, 8), thread_name_prefix="swarm")
+    )
+
     ui = SwarmUI()
 
     # Load config if available
@@ -235,17 +366,7 @@ async def _run_swarm(
     ui.print_plan(plan)
 
     # Record the plan
-    recorder.record_plan({
-        "tasks": [
-            {
-                "id": t.id,
-                "description": t.description,
-                "agent_type": t.agent_type,
-                "dependencies": t.dependencies,
-            }
-            for t in plan.tasks
-        ]
-    })
+    recorder.record_plan_tasks(plan.tasks)
 
     if dry_run:
         ui.console.print("[yellow]Dry run — not executing tasks[/yellow]")
@@ -347,4 +468,4 @@ async def _run_swarm(
 
 
 if __name__ == "__main__":
-    main()
+    entry()
@@ -35,6 +35,8 @@ Example swarm.yaml:
 
 from __future__ import annotations
 
+import functools
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -42,11 +44,23 @@ from typing import Any
 try:
     import yaml
 
+    try:
+        # libyaml parses in native code — roughly an order of magnitude
+        # faster than the pure-Python loader on the same document.
+        from yaml import CSafeLoader as _SafeLoader
+    except ImportError:
+        from yaml import SafeLoader as _SafeLoader
+
     HAS_YAML = True
 except ImportError:
     HAS_YAML = False
 
 
+# Shared immutable tool default — one tuple for every agent that doesn't
+# override tools, instead of a fresh six-element list per instance.
+_DEFAULT_TOOLS: tuple[str, ...] = ("Read", "Write", "Edit", "Bash", "Grep", "Glob")
+
+
 @dataclass
 class AgentConfig:
     """Configuration for a custom agent type."""
@@ -54,12 +68,15 @@ class AgentConfig:
     name: str
     description: str
     model: str = "haiku"
-    tools: list[str] = field(
-        default_factory=lambda: ["Read", "Write", "Edit", "Bash", "Grep", "Glob"]
-    )
+    tools: list[str] | tuple[str, ...] = field(default_factory=lambda: _DEFAULT_TOOLS)
     prompt: str = ""
 
 
+# Shared fallback returned for unknown agent types — avoids allocating a
+# fresh default per lookup miss.
+_DEFAULT_AGENT = AgentConfig(name="_default", description="")
+
+
 @dataclass
 class ConnectionConfig:
     """Defines dependency between agent types."""
@@ -91,8 +108,9 @@ class SwarmConfig:
         if not path.exists():
             raise FileNotFoundError(f"Config file not found: {path}")
 
-        with open(path) as f:
-            data = yaml.safe_load(f)
+        # Read as bytes so libyaml handles decoding in C.
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=_SafeLoader)
 
         return cls.from_dict(data)
 
@@ -113,7 +131,7 @@ class SwarmConfig:
                 name=name,
                 description=agent_data.get("description", f"Agent: {name}"),
                 model=agent_data.get("model", "haiku"),
-                tools=agent_data.get("tools", ["Read", "Write", "Edit", "Bash", "Grep", "Glob"]),
+                tools=agent_data.get("tools", _DEFAULT_TOOLS),
                 prompt=agent_data.get("prompt", ""),
             )
 
@@ -131,36 +149,56 @@ class SwarmConfig:
 
         return config
 
+    def get_agent(self, agent_type: str) -> AgentConfig:
+        """Get the config for an agent type, falling back to a shared default.
+
+        Callers that need several fields for the same agent should use this
+        instead of the per-field accessors to avoid repeated dict lookups.
+        """
+        return self.agents.get(agent_type, _DEFAULT_AGENT)
+
     def get_agent_prompt(self, agent_type: str) -> str:
         """Get the prompt for an agent type, with fallback."""
-        if agent_type in self.agents:
-            return self.agents[agent_type].prompt
-        return ""
+        return self.get_agent(agent_type).prompt
 
-    def get_agent_tools(self, agent_type: str) -> list[str]:
+    def get_agent_tools(self, agent_type: str) -> list[str] | tuple[str, ...]:
         """Get tools for an agent type, with fallback."""
-        if agent_type in self.agents:
-            return self.agents[agent_type].tools
-        return ["Read", "Write", "Edit", "Bash", "Grep", "Glob"]
+        return self.get_agent(agent_type).tools
 
     def get_agent_model(self, agent_type: str) -> str:
         """Get model for an agent type, with fallback."""
-        if agent_type in self.agents:
-            return self.agents[agent_type].model
-        return "haiku"
+        return self.get_agent(agent_type).model
 
 
+@functools.lru_cache(maxsize=32)
 def find_config(cwd: str) -> SwarmConfig | None:
-    """Search for swarm.yaml in the project directory."""
-    search_paths = [
-        Path(cwd) / "swarm.yaml",
-        Path(cwd) / "swarm.yml",
-        Path(cwd) / ".claude" / "swarm.yaml",
-        Path(cwd) / ".claude" / "swarm.yml",
-    ]
-
-    for path in search_paths:
-        if path.exists():
-            return SwarmConfig.from_file(path)
+    """Search for swarm.yaml in the project directory.
+
+    Uses a single directory scan per level instead of one stat call
+    per candidate path, keeping the CLI cold-start path cheap. Results
+    are cached per cwd for the process lifetime, and detection can be
+    disabled entirely via the CLAUDE_SWARM_NO_CONFIG environment variable.
+    """
+    if os.environ.get("CLAUDE_SWARM_NO_CONFIG"):
+        return None
+
+    try:
+        names = {entry.name for entry in os.scandir(cwd)}
+    except OSError:
+        return None
+
+    for filename in ("swarm.yaml", "swarm.yml"):
+        if filename in names:
+            return SwarmConfig.from_file(Path(cwd) / filename)
+
+    if ".claude" in names:
+        claude_dir = Path(cwd) / ".claude"
+        try:
+            claude_names = {entry.name for entry in os.scandir(claude_dir)}
+        except OSError:
+            return None
+        for filename in ("swarm.yaml", "swarm.yml"):
+            if filename in claude_names:
+                return SwarmConfig.from_file(claude_dir / filename)
 
     return None
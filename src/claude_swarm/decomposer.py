@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import json
+import re
+import string
 import uuid
+from typing import Any
 
 from claude_agent_sdk import ClaudeAgentOptions, query
 from claude_agent_sdk.types import AssistantMessage, ResultMessage, TextBlock
@@ -50,6 +53,20 @@ IMPORTANT:
 - Keep the total number of tasks between 2 and 8
 - Each task's prompt should be self-contained with all context needed"""
 
+# Only the variable tail is rendered per call; the static system prompt
+# goes out via ClaudeAgentOptions.system_prompt so the API can
+# prompt-cache it across repeated decompositions.
+_DECOMPOSE_TEMPLATE = string.Template(
+    """PROJECT DIRECTORY: $cwd
+
+TASK TO DECOMPOSE:
+$task
+
+First, explore the codebase to understand the structure. \
+Then output your decomposition as a JSON code block.
+"""
+)
+
 
 async def decompose_task(
     prompt: str,
@@ -71,41 +88,77 @@ async def decompose_task(
         cwd=cwd,
         permission_mode="default",
         max_turns=3,
+        system_prompt=DECOMPOSE_SYSTEM_PROMPT,
     )
 
-    decompose_prompt = f"""{DECOMPOSE_SYSTEM_PROMPT}
-
-PROJECT DIRECTORY: {cwd}
+    decompose_prompt = _DECOMPOSE_TEMPLATE.substitute(cwd=cwd, task=prompt)
 
-TASK TO DECOMPOSE:
-{prompt}
-
-First, explore the codebase to understand the structure. \
-Then output your decomposition as a JSON code block.
-"""
-
-    collected_text = ""
+    # Accumulate chunks and join once — repeated str concatenation is
+    # quadratic on large Opus outputs.
+    chunks: list[str] = []
     total_cost = 0.0
+    fence_markers = 0
+    tasks: list[SwarmTask] | None = None
 
+    # Exact-type checks: the SDK yields these concrete types, and
+    # `type(x) is C` skips the MRO walk isinstance does per streamed block.
     async for message in query(prompt=decompose_prompt, options=options):
-        if isinstance(message, AssistantMessage):
+        mtype = type(message)
+        if mtype is AssistantMessage:
             for block in message.content:
-                if isinstance(block, TextBlock):
-                    collected_text += block.text
-        elif isinstance(message, ResultMessage):
+                if type(block) is TextBlock:
+                    chunks.append(block.text)
+                    if "```" in block.text:
+                        fence_markers += block.text.count("```")
+                        if tasks is None and fence_markers >= 2:
+                            # A fenced block has closed — parse it now so
+                            # the work overlaps with any trailing
+                            # commentary still streaming in, instead of
+                            # serializing after the last token.
+                            tasks = _try_parse_tasks("".join(chunks))
+        elif mtype is ResultMessage:
             total_cost = message.total_cost_usd or 0.0
 
-    # Extract JSON from the response
-    tasks = _parse_decomposition(collected_text)
+    # Extract JSON from the response (unless already parsed mid-stream)
+    if tasks is None:
+        tasks = _parse_decomposition("".join(chunks))
 
     return SwarmPlan(
         original_prompt=prompt,
         tasks=tasks,
-        estimated_total_cost=total_cost * len(tasks),  # rough estimate
+        estimated_total_cost=total_cost,  # decomposition cost; execution is estimated live
         model_used=model,
     )
 
 
+# Canonical tool tuples — tasks sharing a tool set share one object, so
+# downstream caches keyed on tools (e.g. the orchestrator's options pool)
+# hash identical keys. The default set is pre-registered since the vast
+# majority of tasks use it.
+_DEFAULT_TOOLS: tuple[str, ...] = ("Read", "Write", "Edit", "Bash", "Grep", "Glob")
+_TOOL_INTERN: dict[tuple[str, ...], tuple[str, ...]] = {
+    tuple(sorted(_DEFAULT_TOOLS)): tuple(sorted(_DEFAULT_TOOLS))
+}
+
+
+def _intern_tools(tools: list[str] | tuple[str, ...]) -> tuple[str, ...]:
+    """Canonicalize a tool list to a shared sorted tuple."""
+    key = tuple(sorted(tools))
+    return _TOOL_INTERN.setdefault(key, key)
+
+
+def _try_parse_tasks(text: str) -> list[SwarmTask] | None:
+    """Attempt to parse a task decomposition; None if no valid JSON yet."""
+    json_str = _extract_json_block(text)
+    if not json_str:
+        return None
+    try:
+        data = json.loads(json_str)
+    except json.JSONDecodeError:
+        return None
+    return _build_tasks(data)
+
+
 def _parse_decomposition(text: str) -> list[SwarmTask]:
     """Parse the JSON task decomposition from Opus's response."""
     # Find JSON block in the response
@@ -124,10 +177,15 @@ def _parse_decomposition(text: str) -> list[SwarmTask]:
                 description="Execute the original task (decomposition failed)",
                 agent_type="coder",
                 prompt=text,
-                tools=["Read", "Write", "Edit", "Bash", "Grep", "Glob"],
+                tools=_intern_tools(_DEFAULT_TOOLS),
             )
         ]
 
+    return _build_tasks(data)
+
+
+def _build_tasks(data: Any) -> list[SwarmTask]:
+    """Construct SwarmTasks from a parsed decomposition document."""
     tasks_data = data.get("tasks", data) if isinstance(data, dict) else data
 
     tasks: list[SwarmTask] = []
@@ -138,7 +196,7 @@ def _parse_decomposition(text: str) -> list[SwarmTask]:
             agent_type=item.get("agent_type", "coder"),
             dependencies=item.get("dependencies", []),
             files_to_modify=item.get("files_to_modify", []),
-            tools=item.get("tools", ["Read", "Write", "Edit", "Bash", "Grep", "Glob"]),
+            tools=_intern_tools(item.get("tools", _DEFAULT_TOOLS)),
             prompt=item.get("prompt", item.get("description", "")),
             status=TaskStatus.PENDING,
         )
@@ -147,31 +205,39 @@ def _parse_decomposition(text: str) -> list[SwarmTask]:
     return tasks
 
 
+# Matches a fenced JSON block (```json ... ``` or a bare ``` fence opening
+# on an object) in one C-level scan.
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+
 def _extract_json_block(text: str) -> str | None:
     """Extract a JSON code block from markdown-formatted text."""
     # Try ```json ... ``` first
-    start_markers = ["```json\n", "```json\r\n", "```\n{"]
-    for marker in start_markers:
-        start = text.find(marker)
-        if start != -1:
-            # Adjust start position
-            if marker == "```\n{":
-                start += 4  # skip ```\n, keep {
-            else:
-                start += len(marker)
-            end = text.find("```", start)
-            if end != -1:
-                return text[start:end].strip()
-
-    # Try finding raw JSON object
+    match = _JSON_FENCE.search(text)
+    if match:
+        return match.group(1)
+
+    # Try finding a raw JSON object: one pass tracking brace depth, skipping
+    # over string literals so a `}` inside a JSON string doesn't mis-close.
     start = text.find("{")
     if start != -1:
-        # Find the matching closing brace
         depth = 0
+        in_string = False
+        escape = False
         for i in range(start, len(text)):
-            if text[i] == "{":
+            ch = text[i]
+            if in_string:
+                if escape:
+                    escape = False
+                elif ch == "\\":
+                    escape = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch == "{":
                 depth += 1
-            elif text[i] == "}":
+            elif ch == "}":
                 depth -= 1
                 if depth == 0:
                     return text[start : i + 1]
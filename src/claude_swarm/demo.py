@@ -113,13 +113,14 @@ DEMO_SCENARIOS = {
     },
 }
 
-# Simulated tool sequences for different agent types
+# Simulated tool sequences for different agent types (tuples: immutable,
+# shared across waves with no per-loop copies)
 TOOL_SEQUENCES = {
-    "coder": ["Read", "Grep", "Glob", "Read", "Write", "Edit", "Read", "Edit", "Bash"],
-    "tester": ["Read", "Glob", "Write", "Bash", "Edit", "Bash"],
-    "reviewer": ["Read", "Grep", "Glob", "Read", "Grep", "Read"],
-    "refactorer": ["Read", "Grep", "Read", "Edit", "Edit", "Bash"],
-    "documenter": ["Read", "Glob", "Write", "Edit"],
+    "coder": ("Read", "Grep", "Glob", "Read", "Write", "Edit", "Read", "Edit", "Bash"),
+    "tester": ("Read", "Glob", "Write", "Bash", "Edit", "Bash"),
+    "reviewer": ("Read", "Grep", "Glob", "Read", "Grep", "Read"),
+    "refactorer": ("Read", "Grep", "Read", "Edit", "Edit", "Bash"),
+    "documenter": ("Read", "Glob", "Write", "Edit"),
 }
 
 
@@ -170,6 +171,7 @@ async def run_demo(
         scenario = "auth"
 
     plan = _build_demo_plan(scenario)
+    task_by_id = {t.id: t for t in plan.tasks}
     if prompt:
         plan.original_prompt = prompt
 
@@ -194,7 +196,7 @@ async def run_demo(
             # Launch agents for this wave
             wave_agents: list[tuple[SwarmTask, SwarmAgent]] = []
             for task_id in group:
-                task = next(t for t in plan.tasks if t.id == task_id)
+                task = task_by_id[task_id]
                 task.status = TaskStatus.RUNNING
 
                 agent_id = f"agent-{task.id}"
@@ -207,22 +209,28 @@ async def run_demo(
                 agents[agent_id] = agent
                 wave_agents.append((task, agent))
 
-            # Simulate tool usage for each agent in this wave
-            max_tools = max(
-                len(TOOL_SEQUENCES.get(t.agent_type, ["Read"])) for t, _ in wave_agents
-            )
+            # Simulate tool usage for each agent in this wave. Hoist the
+            # per-iteration dict lookups and RNG method resolution out of
+            # the inner loop.
+            tool_seqs = [TOOL_SEQUENCES.get(t.agent_type, ("Read",)) for t, _ in wave_agents]
+            tool_lens = [len(seq) for seq in tool_seqs]
+            max_tools = max(tool_lens)
+            _uniform = random.uniform
 
             for tool_idx in range(max_tools):
-                for task, agent in wave_agents:
-                    tools = TOOL_SEQUENCES.get(task.agent_type, ["Read"])
-                    if tool_idx < len(tools):
+                for (task, agent), tools, n_tools in zip(
+                    wave_agents, tool_seqs, tool_lens, strict=True
+                ):
+                    if tool_idx < n_tools:
                         agent.current_tool = tools[tool_idx]
                         agent.turns = tool_idx + 1
-                        # Simulate cost accumulation
-                        agent.cost_usd += random.uniform(0.001, 0.008)
+                        # Simulate cost accumulation (threaded into the
+                        # running total instead of re-summing all agents)
+                        delta = _uniform(0.001, 0.008)
+                        agent.cost_usd += delta
                         task.cost_usd = agent.cost_usd
+                        total_cost += delta
 
-                total_cost = sum(a.cost_usd for a in agents.values())
                 dashboard = ui.create_dashboard(plan, agents, total_cost, conflicts)
                 live.update(dashboard)
                 await asyncio.sleep(0.4 / speed)
@@ -235,7 +243,6 @@ async def run_demo(
                 agent.current_tool = None
                 completed_ids.add(task.id)
 
-            total_cost = sum(a.cost_usd for a in agents.values())
             dashboard = ui.create_dashboard(plan, agents, total_cost, conflicts)
             live.update(dashboard)
             await asyncio.sleep(0.8 / speed)
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import time
 import uuid
+from collections import deque
 from collections.abc import Callable
+from dataclasses import replace
 from typing import Any
 
 import anyio
@@ -31,11 +33,20 @@ from .types import (
     TaskStatus,
 )
 
+# Minimum interval between UI redraws; dirty-flag events arriving inside
+# one window coalesce into a single on_update call.
+_UI_FLUSH_INTERVAL = 0.1
+
 # Callback type for UI updates
 OnUpdate = Callable[[], None]
 OnAgentEvent = Callable[[str, str, Any], None]  # agent_id, event_type, data
 
 
+def _noop_agent_event(*_: Any) -> None:
+    """Default on_agent_event — identity-checked on hot paths to skip
+    building event payload dicts nobody will see."""
+
+
 class SwarmOrchestrator:
     """Orchestrates parallel Claude Code agents with dependency tracking.
 
@@ -60,7 +71,7 @@ class SwarmOrchestrator:
         self.max_concurrent = max_concurrent
         self.max_budget_usd = max_budget_usd
         self.on_update = on_update or (lambda: None)
-        self.on_agent_event = on_agent_event or (lambda *_: None)
+        self.on_agent_event = on_agent_event or _noop_agent_event
         self.recorder = recorder
         self.max_retries = max_retries
 
@@ -71,20 +82,84 @@ class SwarmOrchestrator:
         self.total_cost: float = 0.0
         self.start_time: float = 0.0
         self._budget_exceeded: bool = False
+        self._budget_warned: bool = False
+
+        # Rolling per-task cost estimate (EWMA) — converges as tasks
+        # finish so the budget check can trip before overshooting.
+        self._cost_ewma: float = 0.0
 
         # Retry tracking: task_id -> attempt count
         self._retry_counts: dict[str, int] = {}
 
-        # Map file paths to agent IDs currently modifying them
+        # Scheduler wakeup — set whenever a task reaches a terminal state so
+        # the run loop reschedules immediately instead of polling. Created
+        # lazily in run() because anyio primitives need a running loop.
+        self._wake: anyio.Event | None = None
+
+        # Concurrency gate — acquired by each agent, so admission control
+        # is handled by the runtime rather than polling active counts.
+        self._slots: anyio.Semaphore | None = None
+
+        # UI coalescing — internal call sites set a dirty flag and a
+        # background task flushes to on_update at most every 100 ms, so
+        # bursts of tool-use events don't each trigger a dashboard rebuild.
+        self._dirty: anyio.Event | None = None
+
+        # Base agent options pooled by tool set — most tasks share the
+        # default tools, so they reuse one options object and only the
+        # per-agent hooks are bound at query time.
+        self._options_cache: dict[tuple[str, ...], ClaudeAgentOptions] = {}
+
+        # Map file paths to the owning task's id, plus the reverse index
+        # so releasing a task's locks is a single pop that only drops
+        # locks the task still owns.
         self._file_locks: dict[str, str] = {}
+        self._task_files: dict[str, frozenset[str]] = {}
 
         # Task lookup
         self._tasks: dict[str, SwarmTask] = {t.id: t for t in plan.tasks}
 
+        # Dependency bookkeeping: the plan's cached reverse graph plus
+        # unmet-dependency counts and a ready queue, so each scheduling
+        # pass is O(ready) instead of rescanning the whole task list.
+        self._dependents = plan.dependents
+        self._remaining_deps: dict[str, int] = {}
+        self._ready: deque[SwarmTask] = deque()
+        self._done_count: int = 0
+
+        # Terminal tasks collected as they transition, so the final
+        # SwarmResult is a list handoff rather than two full-plan sweeps.
+        self._completed: list[SwarmTask] = []
+        self._failed: list[SwarmTask] = []
+
+        terminal = (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED)
+        for task in plan.tasks:
+            unmet = 0
+            for dep in task.dependencies:
+                dep_task = self._tasks.get(dep)
+                if dep_task is not None and dep_task.status is TaskStatus.COMPLETED:
+                    continue
+                unmet += 1
+            self._remaining_deps[task.id] = unmet
+            if unmet == 0 and task.status is TaskStatus.PENDING:
+                self._ready.append(task)
+            if task.status in terminal:
+                self._done_count += 1
+                if task.status is TaskStatus.COMPLETED:
+                    self._completed.append(task)
+                elif task.status is TaskStatus.FAILED:
+                    self._failed.append(task)
+
     @property
     def active_agent_count(self) -> int:
         """Count agents currently working."""
-        return sum(1 for a in self.agents.values() if a.status == AgentStatus.WORKING)
+        return sum(1 for a in self.agents.values() if a.status is AgentStatus.WORKING)
+
+    @property
+    def estimated_remaining_cost(self) -> float:
+        """Projected spend for tasks not yet terminal, from the cost EWMA."""
+        remaining = len(self.plan.tasks) - self._done_count
+        return self._cost_ewma * remaining
 
     async def run(self) -> SwarmResult:
         """Execute all tasks in the plan, respecting dependencies.
@@ -95,59 +170,144 @@ class SwarmOrchestrator:
             SwarmResult with completed/failed tasks and statistics
         """
         self.start_time = time.monotonic()
+        self._wake = anyio.Event()
+        self._slots = anyio.Semaphore(self.max_concurrent)
+        self._dirty = anyio.Event()
 
         async with anyio.create_task_group() as tg:
+            tg.start_soon(self._flush_ui_updates)
             while not self._all_done():
-                # Budget enforcement: cancel pending tasks if over budget
+                # Budget enforcement: cancel pending tasks only on actual
+                # overspend. The EWMA projection is advisory — one early
+                # expensive task would otherwise cancel a plan that is
+                # genuinely under budget.
                 if self.total_cost >= self.max_budget_usd and not self._budget_exceeded:
                     self._budget_exceeded = True
                     self._cancel_pending_tasks(
                         reason=(
-                            f"Budget exceeded: ${self.total_cost:.4f}"
-                            f" >= ${self.max_budget_usd:.2f}"
+                            f"Budget exceeded: ${self.total_cost:.4f} spent"
+                            f" vs ${self.max_budget_usd:.2f}"
                         )
                     )
-                    self.on_update()
-                    # Wait for running agents to finish, but don't launch new ones
-                    if self.active_agent_count == 0:
+                    self._mark_dirty()
+                elif not self._budget_warned and (
+                    self.total_cost + self.estimated_remaining_cost
+                    > self.max_budget_usd * 1.1
+                ):
+                    self._budget_warned = True
+                    self.on_agent_event(
+                        "orchestrator",
+                        "budget_projection",
+                        {
+                            "spent": self.total_cost,
+                            "projected": self.estimated_remaining_cost,
+                            "budget": self.max_budget_usd,
+                        },
+                    )
+                if self._budget_exceeded:
+                    # Don't launch anything new. Dispatched tasks stay
+                    # RUNNING until their agent finishes or, if still
+                    # queued on the semaphore, cancels itself at slot
+                    # acquisition — only exit once none remain, so the
+                    # task-group teardown can't kill them mid-flight.
+                    if not any(
+                        t.status is TaskStatus.RUNNING for t in self.plan.tasks
+                    ):
                         break
-                    await anyio.sleep(0.5)
+                    await self._wait_for_progress()
                     continue
 
-                ready_tasks = self._get_ready_tasks()
-
-                for task in ready_tasks:
-                    if self.active_agent_count >= self.max_concurrent:
-                        break
+                # Dispatch everything ready — the semaphore inside
+                # _run_agent enforces max_concurrent, so a completed wave
+                # admits its successors back-to-back with no scheduler tick.
+                for task in self._get_ready_tasks():
                     # Check for file conflicts before launching
                     conflict = self._check_file_conflict(task)
                     if conflict:
                         self.conflicts.append(conflict)
                         task.status = TaskStatus.BLOCKED
-                        self.on_update()
+                        self._mark_dirty()
                         continue
 
                     task.status = TaskStatus.RUNNING
                     self._lock_files(task)
                     tg.start_soon(self._run_agent, task)
-                    self.on_update()
+                    self._mark_dirty()
+
+                # Sleep until an agent finishes; the timeout is only a
+                # safety net (budget changes, conflict-blocked tasks).
+                await self._wait_for_progress()
 
-                # Brief pause before checking again
-                await anyio.sleep(0.5)
+            # All work is terminal — stop the UI flusher.
+            tg.cancel_scope.cancel()
+
+        # Final flush so the terminal state renders even if the coalescer
+        # was mid-sleep when it was cancelled.
+        self.on_update()
 
         elapsed = int((time.monotonic() - self.start_time) * 1000)
 
         return SwarmResult(
             plan=self.plan,
-            completed_tasks=[t for t in self.plan.tasks if t.status == TaskStatus.COMPLETED],
-            failed_tasks=[t for t in self.plan.tasks if t.status == TaskStatus.FAILED],
+            completed_tasks=self._completed,
+            failed_tasks=self._failed,
             conflicts=self.conflicts,
             total_cost_usd=self.total_cost,
             total_duration_ms=elapsed,
             agents_used=len(self.agents),
         )
 
+    def _mark_dirty(self) -> None:
+        """Request a UI redraw; coalesced by the background flusher."""
+        if self._dirty is not None:
+            self._dirty.set()
+        else:
+            self.on_update()
+
+    async def _flush_ui_updates(self) -> None:
+        """Flush dirty-flag notifications to on_update at most every 100 ms.
+
+        Bursty phases (dozens of tool_use events in one interval) collapse
+        to a single redraw per window, with no visible latency at Live's
+        refresh cadence.
+        """
+        assert self._dirty is not None
+        while True:
+            await self._dirty.wait()
+            self._dirty = anyio.Event()
+            self.on_update()
+            await anyio.sleep(_UI_FLUSH_INTERVAL)
+
+    async def _wait_for_progress(self, timeout: float = 0.5) -> None:
+        """Sleep until a task reaches a terminal state (or the timeout)."""
+        assert self._wake is not None
+        with anyio.move_on_after(timeout):
+            await self._wake.wait()
+        self._wake = anyio.Event()
+
+    def _notify_progress(self) -> None:
+        """Wake the scheduler loop, if it is running."""
+        if self._wake is not None:
+            self._wake.set()
+
     async def _run_agent(self, task: SwarmTask) -> None:
+        """Run a single agent for a task, once a concurrency slot frees up."""
+        assert self._slots is not None
+        async with self._slots:
+            if self._budget_exceeded:
+                # Dispatched before the budget tripped but never started —
+                # _cancel_pending_tasks couldn't reach it (already marked
+                # RUNNING), so it cancels itself here instead of spending.
+                task.status = TaskStatus.CANCELLED
+                task.error = "Cancelled before start: budget exceeded"
+                self._done_count += 1
+                self._unlock_files(task)
+                self._notify_progress()
+                self._mark_dirty()
+                return
+            await self._execute_task(task)
+
+    async def _execute_task(self, task: SwarmTask) -> None:
         """Run a single agent for a task."""
         agent_id = f"agent-{uuid.uuid4().hex[:8]}"
         agent = SwarmAgent(
@@ -160,50 +320,57 @@ class SwarmOrchestrator:
         self.on_agent_event(agent_id, "started", {"task_id": task.id})
         if self.recorder:
             self.recorder.record_agent_started(agent_id, task.id, task.description)
-        self.on_update()
+        self._mark_dirty()
 
         try:
-            # Create hooks for tracking this agent's activity
+            # Create hooks for tracking this agent's activity and bind them
+            # onto the pooled base options for this task's tool set.
             hooks = self._create_agent_hooks(agent)
+            options = replace(self._base_options(task), hooks=hooks)
 
-            options = ClaudeAgentOptions(
-                model="haiku",
-                cwd=self.cwd,
-                permission_mode="acceptEdits",
-                max_turns=20,
-                max_budget_usd=0.50,
-                hooks=hooks,
-                allowed_tools=task.tools,
-            )
-
-            collected_text = ""
+            text_chunks: list[str] = []
             task_start = time.monotonic()
 
+            # Bind per-block callees once; each is otherwise re-resolved via
+            # two attribute lookups for every streamed tool-use block.
+            on_event = self.on_agent_event if self.on_agent_event is not _noop_agent_event else None
+            rec_tool_use = self.recorder.record_tool_use if self.recorder else None
+            mark_dirty = self._mark_dirty
+
+            # Exact-type checks (`type(x) is C`) avoid isinstance's MRO walk
+            # on every streamed message/block; the SDK yields these concrete
+            # types directly.
             async for message in query(prompt=task.prompt, options=options):
-                if isinstance(message, AssistantMessage):
+                mtype = type(message)
+                if mtype is AssistantMessage:
                     for block in message.content:
-                        if isinstance(block, TextBlock):
-                            collected_text += block.text
-                        elif isinstance(block, ToolUseBlock):
+                        btype = type(block)
+                        if btype is TextBlock:
+                            text_chunks.append(block.text)
+                        elif btype is ToolUseBlock:
                             agent.current_tool = block.name
                             agent.turns += 1
-                            self.on_agent_event(
-                                agent_id, "tool_use", {"tool": block.name, "input": block.input}
-                            )
-                            if self.recorder:
-                                self.recorder.record_tool_use(
-                                    agent_id, task.id, block.name, block.input
+                            if on_event is not None:
+                                on_event(
+                                    agent_id,
+                                    "tool_use",
+                                    {"tool": block.name, "input": block.input},
                                 )
-                            self.on_update()
-                elif isinstance(message, ResultMessage):
+                            if rec_tool_use is not None:
+                                rec_tool_use(agent_id, task.id, block.name, block.input)
+                            mark_dirty()
+                elif mtype is ResultMessage:
                     task.cost_usd = message.total_cost_usd or 0.0
                     self.total_cost += task.cost_usd
 
             task.duration_ms = int((time.monotonic() - task_start) * 1000)
-            task.result = collected_text
+            task.result = "".join(text_chunks)
             task.status = TaskStatus.COMPLETED
             task.assigned_agent = agent_id
             self.completed_task_ids.add(task.id)
+            self._done_count += 1
+            self._completed.append(task)
+            self._cost_ewma = 0.8 * self._cost_ewma + 0.2 * task.cost_usd
 
             agent.status = AgentStatus.COMPLETED
             agent.cost_usd = task.cost_usd
@@ -222,6 +389,7 @@ class SwarmOrchestrator:
                 # Reset task for retry
                 task.status = TaskStatus.PENDING
                 task.error = None
+                self._ready.append(task)
                 agent.status = AgentStatus.FAILED
                 self.on_agent_event(
                     agent_id, "retry", {"error": str(exc), "attempt": attempt}
@@ -233,6 +401,8 @@ class SwarmOrchestrator:
             else:
                 task.status = TaskStatus.FAILED
                 task.error = str(exc)
+                self._done_count += 1
+                self._failed.append(task)
                 agent.status = AgentStatus.FAILED
                 self.on_agent_event(agent_id, "failed", {"error": str(exc)})
                 if self.recorder:
@@ -242,7 +412,24 @@ class SwarmOrchestrator:
             self._unlock_files(task)
             # Unblock dependent tasks
             self._update_blocked_tasks(task.id)
-            self.on_update()
+            self._notify_progress()
+            self._mark_dirty()
+
+    def _base_options(self, task: SwarmTask) -> ClaudeAgentOptions:
+        """Get (or build once) the shared agent options for a task's tool set."""
+        key = tuple(sorted(task.tools))
+        options = self._options_cache.get(key)
+        if options is None:
+            options = ClaudeAgentOptions(
+                model="haiku",
+                cwd=self.cwd,
+                permission_mode="acceptEdits",
+                max_turns=20,
+                max_budget_usd=0.50,
+                allowed_tools=task.tools,
+            )
+            self._options_cache[key] = options
+        return options
 
     def _create_agent_hooks(self, agent: SwarmAgent) -> dict[str, list[HookMatcher]]:
         """Create hooks to track an agent's file modifications."""
@@ -250,13 +437,12 @@ class SwarmOrchestrator:
         async def track_file_writes(
             input_data: HookInput, tool_use_id: str | None, context: HookContext
         ) -> HookJSONOutput:
-            tool_name = input_data.get("tool_name", "")
-            tool_input = input_data.get("tool_input", {})
+            if input_data.get("tool_name", "") not in ("Write", "Edit"):
+                return {}
 
-            if tool_name in ("Write", "Edit"):
-                file_path = tool_input.get("file_path", "")
-                if file_path and file_path not in agent.files_modified:
-                    agent.files_modified.append(file_path)
+            file_path = input_data.get("tool_input", {}).get("file_path", "")
+            if file_path:
+                agent.files_modified.setdefault(file_path, None)
 
             return {}
 
@@ -267,57 +453,70 @@ class SwarmOrchestrator:
         }
 
     def _get_ready_tasks(self) -> list[SwarmTask]:
-        """Get tasks whose dependencies are all completed."""
+        """Drain the ready queue of tasks whose dependencies are all completed.
+
+        Callers are responsible for requeueing tasks they do not launch.
+        """
         ready = []
-        for task in self.plan.tasks:
-            if task.status != TaskStatus.PENDING:
-                continue
-            deps_met = all(d in self.completed_task_ids for d in task.dependencies)
-            if deps_met:
+        while self._ready:
+            task = self._ready.popleft()
+            if task.status is TaskStatus.PENDING:
                 ready.append(task)
         return ready
 
     def _all_done(self) -> bool:
         """Check if all tasks are either completed, failed, or cancelled."""
-        return all(
-            t.status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED)
-            for t in self.plan.tasks
-        )
+        return self._done_count >= len(self.plan.tasks)
 
     def _check_file_conflict(self, task: SwarmTask) -> FileConflict | None:
-        """Check if a task would conflict with currently running agents."""
-        for file_path in task.files_to_modify:
-            if file_path in self._file_locks:
-                other_agent_id = self._file_locks[file_path]
-                other_agent = self.agents.get(other_agent_id)
-                if other_agent and other_agent.status == AgentStatus.WORKING:
-                    return FileConflict(
-                        file_path=file_path,
-                        agent_ids=[other_agent_id, "pending"],
-                        task_ids=[other_agent.task_id, task.id],
-                    )
+        """Check if a task would conflict with a currently running task."""
+        if not task.files_to_modify:
+            return None
+        # One C-level set intersection instead of a Python-level dict
+        # lookup per file; only actual overlaps get the per-path checks.
+        for file_path in self._file_locks.keys() & set(task.files_to_modify):
+            owner_id = self._file_locks[file_path]
+            owner = self._tasks.get(owner_id)
+            if owner is not None and owner.status is TaskStatus.RUNNING:
+                return FileConflict(
+                    file_path=file_path,
+                    agent_ids=[owner.assigned_agent or owner_id, "pending"],
+                    task_ids=[owner_id, task.id],
+                )
         return None
 
     def _lock_files(self, task: SwarmTask) -> None:
         """Lock files that a task will modify."""
-        agent_id = task.assigned_agent or task.id
-        for file_path in task.files_to_modify:
-            self._file_locks[file_path] = agent_id
+        # Owned by task id, not agent id: locking happens in the scheduler
+        # before an agent is assigned, and the owner key must be identical
+        # at unlock time after assigned_agent has been filled in.
+        files = frozenset(task.files_to_modify)
+        self._task_files[task.id] = files
+        for file_path in files:
+            self._file_locks[file_path] = task.id
 
     def _unlock_files(self, task: SwarmTask) -> None:
         """Unlock files after a task completes."""
-        for file_path in task.files_to_modify:
-            if file_path in self._file_locks:
+        for file_path in self._task_files.pop(task.id, ()):
+            # Only drop locks this task still holds — another task may
+            # have re-acquired the path since.
+            if self._file_locks.get(file_path) == task.id:
                 del self._file_locks[file_path]
 
     def _update_blocked_tasks(self, completed_task_id: str) -> None:
         """Unblock tasks that were waiting on a completed task."""
-        for task in self.plan.tasks:
-            if task.status == TaskStatus.BLOCKED and completed_task_id in task.dependencies:
-                # Check if all other deps are also met
-                deps_met = all(d in self.completed_task_ids for d in task.dependencies)
-                if deps_met:
-                    task.status = TaskStatus.PENDING
+        if completed_task_id not in self.completed_task_ids:
+            # Failed/cancelled tasks don't satisfy anyone's dependencies.
+            return
+        for dependent_id in self._dependents.get(completed_task_id, ()):
+            remaining = self._remaining_deps[dependent_id] - 1
+            self._remaining_deps[dependent_id] = remaining
+            if remaining == 0:
+                dependent = self._tasks[dependent_id]
+                if dependent.status is TaskStatus.BLOCKED:
+                    dependent.status = TaskStatus.PENDING
+                if dependent.status is TaskStatus.PENDING:
+                    self._ready.append(dependent)
 
     def _cancel_pending_tasks(self, reason: str) -> None:
         """Cancel all pending and blocked tasks (e.g., when budget is exceeded)."""
@@ -325,4 +524,6 @@ class SwarmOrchestrator:
             if task.status in (TaskStatus.PENDING, TaskStatus.BLOCKED):
                 task.status = TaskStatus.CANCELLED
                 task.error = reason
+                self._done_count += 1
+        self._notify_progress()
         self.on_agent_event("orchestrator", "budget_exceeded", {"reason": reason})
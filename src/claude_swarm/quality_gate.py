@@ -13,13 +13,29 @@ demonstrates strategic Opus 4.6 usage for the hardest reasoning tasks.
 
 from __future__ import annotations
 
+import asyncio
 import json
+import re
 from dataclasses import dataclass, field
+from typing import Any
+
+try:
+    # C-implemented decoder, several times faster than stdlib json on the
+    # full review documents Opus returns. Optional dependency.
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from claude_agent_sdk import ClaudeAgentOptions, query
 from claude_agent_sdk.types import AssistantMessage, ResultMessage, TextBlock
 
-from .types import SwarmResult
+from .types import SwarmResult, SwarmTask, TaskStatus
+
+# TaskStatus is a closed enum, so the uppercase display form of every
+# status can be looked up rather than re-built with .upper() per task.
+_STATUS_UPPER = {status: status.name for status in TaskStatus}
 
 QUALITY_GATE_PROMPT = (
     "You are a senior software architect performing a quality review of work "
@@ -52,8 +68,39 @@ QUALITY_GATE_PROMPT = (
     "Be thorough but fair. Focus on actionable feedback."
 )
 
+INTEGRATION_PROMPT = (
+    "You are a senior software architect combining several chunked quality "
+    "reviews of one project into a final assessment.\n\n"
+    "ORIGINAL TASK:\n{original_prompt}\n\n"
+    "CHUNK REVIEWS:\n{chunk_notes}\n\n"
+    "ISSUES RAISED ACROSS CHUNKS:\n{issues}\n\n"
+    "OUTPUT FORMAT (strict JSON):\n"
+    "{{\n"
+    '  "overall_score": 1-10,\n'
+    '  "verdict": "pass" | "needs_revision" | "fail",\n'
+    '  "summary": "Brief overall assessment",\n'
+    '  "integration_issues": ["issues with how tasks work together"],\n'
+    '  "missing_items": ["things not addressed by any task"]\n'
+    "}}\n\n"
+    "Weigh the chunk verdicts and cross-chunk issues; do not re-review code."
+)
+
+# Chunked reviews run on a cheaper model in parallel; the expensive model
+# is reserved for the final integration pass.
+CHUNK_REVIEW_MODEL = "sonnet"
+
+# Split the gate prompt once at import around its two placeholders, so a
+# per-call render is plain concatenation instead of str.format re-scanning
+# the multi-KB template. The doubled braces in the JSON schema exist only
+# for format's benefit and are un-escaped here.
+_QG_HEAD, _qg_rest = QUALITY_GATE_PROMPT.split("{original_prompt}")
+_QG_MID, _QG_TAIL = _qg_rest.split("{task_summaries}")
+_QG_HEAD, _QG_MID, _QG_TAIL = (
+    part.replace("{{", "{").replace("}}", "}") for part in (_QG_HEAD, _QG_MID, _QG_TAIL)
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class TaskReview:
     """Review of a single task's output."""
 
@@ -63,7 +110,7 @@ class TaskReview:
     suggestions: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class QualityReport:
     """Result of the Opus quality gate review."""
 
@@ -80,6 +127,7 @@ async def run_quality_gate(
     result: SwarmResult,
     cwd: str,
     model: str = "opus",
+    chunk_size: int | None = None,
 ) -> QualityReport:
     """Run Opus 4.6 quality gate on completed agent work.
 
@@ -87,44 +135,134 @@ async def run_quality_gate(
         result: The SwarmResult from orchestrator execution
         cwd: Working directory
         model: Model for review (default: opus)
+        chunk_size: If set and the plan has more tasks than this, review
+            tasks in parallel chunks on a cheaper model, with ``model``
+            reserved for a final integration pass
 
     Returns:
         QualityReport with scores, issues, and suggestions
     """
-    task_summaries = _build_task_summaries(result)
+    if chunk_size and len(result.plan.tasks) > chunk_size:
+        return await _run_chunked_quality_gate(result, cwd, model, chunk_size)
+
+    prompt = (
+        f"{_QG_HEAD}{result.plan.original_prompt}{_QG_MID}{_build_task_summaries(result)}{_QG_TAIL}"
+    )
+    data, review_cost = await _collect_review(prompt, _review_options(model, cwd))
+    return _report_from_data(data, review_cost)
+
+
+async def _run_chunked_quality_gate(
+    result: SwarmResult,
+    cwd: str,
+    model: str,
+    chunk_size: int,
+) -> QualityReport:
+    """Map-reduce review: parallel per-chunk reviews, then one integration pass.
 
-    prompt = QUALITY_GATE_PROMPT.format(
+    One giant prompt over every task scales latency with plan size; K short
+    parallel calls finish in roughly max(chunk latency) plus the small
+    integration call.
+    """
+    tasks = result.plan.tasks
+    chunks = [tasks[i : i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+
+    chunk_reports = await asyncio.gather(
+        *(_review_chunk(result, chunk, cwd) for chunk in chunks)
+    )
+
+    chunk_notes = "\n".join(
+        f"- Chunk {i} ({len(chunk)} tasks): score {rep.overall_score}/10, "
+        f"verdict {rep.verdict}: {rep.summary}"
+        for i, (chunk, rep) in enumerate(zip(chunks, chunk_reports, strict=True), start=1)
+    )
+    raised = [
+        issue
+        for rep in chunk_reports
+        for issue in (*rep.integration_issues, *rep.missing_items)
+    ]
+    prompt = INTEGRATION_PROMPT.format(
         original_prompt=result.plan.original_prompt,
-        task_summaries=task_summaries,
+        chunk_notes=chunk_notes,
+        issues="\n".join(f"- {issue}" for issue in raised) or "none",
     )
+    data, integration_cost = await _collect_review(prompt, _review_options(model, cwd))
+
+    total_cost = sum(rep.review_cost_usd for rep in chunk_reports) + integration_cost
+    report = _report_from_data(data, total_cost)
+    report.task_reviews = [tr for rep in chunk_reports for tr in rep.task_reviews]
+    return report
+
 
-    options = ClaudeAgentOptions(
+async def _review_chunk(
+    result: SwarmResult, tasks: list[SwarmTask], cwd: str
+) -> QualityReport:
+    """Review one chunk of tasks on the cheaper chunk-review model."""
+    summaries = _build_task_summaries(result, tasks)
+    prompt = f"{_QG_HEAD}{result.plan.original_prompt}{_QG_MID}{summaries}{_QG_TAIL}"
+    data, cost = await _collect_review(prompt, _review_options(CHUNK_REVIEW_MODEL, cwd))
+    return _report_from_data(data, cost)
+
+
+def _review_options(model: str, cwd: str) -> ClaudeAgentOptions:
+    return ClaudeAgentOptions(
         model=model,
         cwd=cwd,
         permission_mode="default",
         max_turns=2,
     )
 
-    collected_text = ""
+
+async def _collect_review(
+    prompt: str, options: ClaudeAgentOptions
+) -> tuple[dict[str, Any] | None, float]:
+    """Stream one review query; return the decoded report and its cost."""
+    # Opus reviews can run to tens of KB; collect chunks and join once
+    # rather than re-concatenating the growing string per block.
+    parts: list[str] = []
     review_cost = 0.0
+    fence_markers = 0
+    data: dict[str, Any] | None = None
 
     async for message in query(prompt=prompt, options=options):
         if isinstance(message, AssistantMessage):
             for block in message.content:
                 if isinstance(block, TextBlock):
-                    collected_text += block.text
+                    parts.append(block.text)
+                    if data is None and "```" in block.text:
+                        fence_markers += block.text.count("```")
+                        if fence_markers >= 2:
+                            # The fenced report has closed — parse it now,
+                            # overlapping with any trailing commentary still
+                            # streaming in.
+                            data = _decode_json("".join(parts))
         elif isinstance(message, ResultMessage):
             review_cost = message.total_cost_usd or 0.0
 
-    return _parse_quality_report(collected_text, review_cost)
+    if data is None:
+        data = _decode_json("".join(parts))
+    return data, review_cost
 
 
-def _build_task_summaries(result: SwarmResult) -> str:
-    """Build a formatted summary of all completed task results."""
-    summaries = []
+# Total characters of task output included in one review prompt, and the
+# per-task weight cap used when dividing it up. A fixed per-task slice
+# would let prompt size (and Opus cost) grow linearly with plan size.
+_SUMMARY_BUDGET = 40_000
+_RESULT_WEIGHT_CAP = 4000
+
+
+def _build_task_summaries(result: SwarmResult, tasks: list[SwarmTask] | None = None) -> str:
+    """Build a formatted summary of task results (all plan tasks by default)."""
+    task_list = tasks if tasks is not None else result.plan.tasks
+
+    # Distribute the output budget proportionally to result length, so a
+    # handful of verbose tasks can't crowd a large plan out of the prompt.
+    weights = [min(len(t.result), _RESULT_WEIGHT_CAP) if t.result else 0 for t in task_list]
+    total_weight = sum(weights)
 
-    for task in result.plan.tasks:
-        status_str = task.status.value.upper()
+    summaries = []
+    for task, weight in zip(task_list, weights, strict=True):
+        status_str = _STATUS_UPPER[task.status]
         files = ", ".join(task.files_to_modify) or "none"
         summary = (
             f"--- Task: {task.id} ({status_str}) ---\n"
@@ -135,8 +273,9 @@ def _build_task_summaries(result: SwarmResult) -> str:
         )
 
         if task.result:
-            result_text = task.result[:2000]
-            if len(task.result) > 2000:
+            budget = _SUMMARY_BUDGET * weight // total_weight
+            result_text = task.result[:budget]
+            if len(task.result) > budget:
                 result_text += "\n... (truncated)"
             summary += f"\nOutput:\n{result_text}"
 
@@ -150,22 +289,16 @@ def _build_task_summaries(result: SwarmResult) -> str:
 
 def _parse_quality_report(text: str, cost: float) -> QualityReport:
     """Parse Opus's quality review response."""
-    json_str = _extract_json(text)
-    if not json_str:
-        return QualityReport(
-            overall_score=7,
-            verdict="pass",
-            summary="Quality review completed (parsing failed)",
-            review_cost_usd=cost,
-        )
+    return _report_from_data(_decode_json(text), cost)
 
-    try:
-        data = json.loads(json_str)
-    except json.JSONDecodeError:
+
+def _report_from_data(data: dict[str, Any] | None, cost: float) -> QualityReport:
+    """Build a QualityReport from a decoded review document."""
+    if data is None:
         return QualityReport(
             overall_score=7,
             verdict="pass",
-            summary="Quality review completed (JSON parse failed)",
+            summary="Quality review completed (parsing failed)",
             review_cost_usd=cost,
         )
 
@@ -191,28 +324,48 @@ def _parse_quality_report(text: str, cost: float) -> QualityReport:
     )
 
 
+# Matches a fenced JSON block (```json ... ```) in one C-level scan.
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+# raw_decode balances braces inside the C-implemented decoder, replacing
+# the old char-by-char Python depth scan and the second json.loads pass.
+_DECODER = json.JSONDecoder()
+
+
+def _decode_json(text: str) -> dict[str, Any] | None:
+    """Decode the first JSON object in text (handles markdown code blocks)."""
+    match = _JSON_FENCE.search(text)
+    if match:
+        # A fenced block is a complete document, so the fast whole-string
+        # decoder applies; raw_decode below handles JSON embedded in prose.
+        candidate = match.group(1)
+        try:
+            obj = orjson.loads(candidate) if HAS_ORJSON else json.loads(candidate)
+        except ValueError:
+            return None
+        return obj if isinstance(obj, dict) else None
+
+    start = text.find("{")
+    if start == -1:
+        return None
+    try:
+        obj, _ = _DECODER.raw_decode(text, start)
+    except json.JSONDecodeError:
+        return None
+    return obj if isinstance(obj, dict) else None
+
+
 def _extract_json(text: str) -> str | None:
     """Extract JSON from text (handles markdown code blocks)."""
-    for marker in ["```json\n", "```json\r\n", "```\n{"]:
-        start = text.find(marker)
-        if start != -1:
-            if marker == "```\n{":
-                start += 4
-            else:
-                start += len(marker)
-            end = text.find("```", start)
-            if end != -1:
-                return text[start:end].strip()
+    match = _JSON_FENCE.search(text)
+    if match:
+        return match.group(1)
 
     start = text.find("{")
-    if start != -1:
-        depth = 0
-        for i in range(start, len(text)):
-            if text[i] == "{":
-                depth += 1
-            elif text[i] == "}":
-                depth -= 1
-                if depth == 0:
-                    return text[start : i + 1]
-
-    return None
+    if start == -1:
+        return None
+    try:
+        _, end = _DECODER.raw_decode(text, start)
+    except json.JSONDecodeError:
+        return None
+    return text[start:end]
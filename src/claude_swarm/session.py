@@ -11,34 +11,68 @@ Sessions are saved to ~/.claude-swarm/sessions/<session-id>/
 
 from __future__ import annotations
 
+import gzip
+import heapq
 import json
+import mmap
+import os
+import sys
 import time
 import uuid
-from dataclasses import dataclass, field
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
+_PLAN_ROW_KEYS = ("id", "description", "agent_type", "dependencies")
+
+try:
+    # orjson decodes/encodes in C, several times faster than stdlib json —
+    # worthwhile for replaying long event streams. Optional dependency.
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    # msgpack frames are roughly half the size of the equivalent JSONL on
+    # disk and decode faster; used for event storage when available.
+    # Optional dependency.
+    from msgspec import msgpack as _msgpack
+
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
 SESSIONS_DIR = Path.home() / ".claude-swarm" / "sessions"
 
+# Events buffered in memory before an incremental flush to disk. Batching
+# amortizes the open/write syscalls over many events while still bounding
+# how much a crash can lose mid-run.
+_FLUSH_BATCH = 64
 
-@dataclass
-class SessionEvent:
-    """A single event in the session timeline."""
 
-    timestamp: float
-    event_type: str  # started, tool_use, completed, failed, conflict, plan_created
-    agent_id: str | None = None
-    task_id: str | None = None
-    data: dict[str, Any] = field(default_factory=dict)
+def _dumps_jsonl(obj: Any) -> bytes:
+    """Serialize one JSONL line (newline included) as bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, default=str) + "\n").encode()
 
-    def to_dict(self) -> dict[str, Any]:
-        return {
-            "timestamp": self.timestamp,
-            "event_type": self.event_type,
-            "agent_id": self.agent_id,
-            "task_id": self.task_id,
-            "data": self.data,
-        }
+
+def _dumps_pretty(obj: Any) -> bytes:
+    """Serialize an indented JSON document as bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, default=str).encode()
+
+
+def _loads(data: bytes | str) -> Any:
+    """Deserialize a JSON document from bytes or text."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class SessionRecorder:
@@ -47,14 +81,36 @@ class SessionRecorder:
     def __init__(self, session_id: str | None = None) -> None:
         self.session_id = session_id or f"swarm-{uuid.uuid4().hex[:12]}"
         self.session_dir = SESSIONS_DIR / self.session_id
-        self.events: list[SessionEvent] = []
+        # Events are kept as plain dicts — the timeline schema is
+        # {timestamp_ms, event_type, agent_id, task_id, data} — since each
+        # event exists only to be JSON-serialized; a dataclass per event
+        # would be one extra allocation on the per-tool-use hot path.
+        self.events: list[dict[str, Any]] = []
         self.start_time = time.time()
+        # Wall-clock start_time goes to metadata; event offsets come from
+        # the monotonic clock, immune to NTP steps mid-session, as exact
+        # integer milliseconds (the duration_ms convention elsewhere).
+        self._start_ns = time.perf_counter_ns()
         self._metadata: dict[str, Any] = {}
+        self._flushed = 0  # index into self.events of the first unflushed event
+        # Batch writes run on a single-worker pool so the encode + disk
+        # write never block the orchestrator's event loop; one worker
+        # keeps appends ordered.
+        self._io_pool: ThreadPoolExecutor | None = None
+        self._last_write: Future[None] | None = None
+        # Resolve file paths once instead of rebuilding the same Path
+        # objects on every batch write.
+        events_name = "events.msgpack" if HAS_MSGSPEC else "events.jsonl.gz"
+        self._events_path = str(self.session_dir / events_name)
+        self._meta_path = str(self.session_dir / "metadata.json")
+        self._dir_ready = False
 
     def start(self, prompt: str, cwd: str) -> None:
         """Initialize a new recording session."""
         self.session_dir.mkdir(parents=True, exist_ok=True)
+        self._dir_ready = True
         self.start_time = time.time()
+        self._start_ns = time.perf_counter_ns()
         self._metadata = {
             "session_id": self.session_id,
             "prompt": prompt,
@@ -68,6 +124,16 @@ class SessionRecorder:
         self._metadata["plan"] = plan_data
         self._record_event("plan_created", data=plan_data)
 
+    def record_plan_tasks(self, tasks: Iterable[Any]) -> None:
+        """Record the decomposed plan directly from task objects.
+
+        Extracts the recorded fields in one C-level pass per task instead
+        of requiring callers to materialize an intermediate dict list.
+        """
+        get = attrgetter("id", "description", "agent_type", "dependencies")
+        rows = [dict(zip(_PLAN_ROW_KEYS, get(t), strict=True)) for t in tasks]
+        self.record_plan({"tasks": rows})
+
     def record_agent_started(self, agent_id: str, task_id: str, task_description: str) -> None:
         """Record an agent starting work."""
         self._record_event(
@@ -85,7 +151,7 @@ class SessionRecorder:
             "tool_use",
             agent_id=agent_id,
             task_id=task_id,
-            data={"tool": tool_name, "input": _truncate_input(tool_input)},
+            data={"tool": sys.intern(tool_name), "input": _truncate_input(tool_input)},
         )
 
     def record_agent_completed(
@@ -120,22 +186,68 @@ class SessionRecorder:
         self._metadata["end_time"] = time.time()
         self._metadata["duration_s"] = self._metadata["end_time"] - self.start_time
         self._metadata["result"] = result_data
+        self._metadata["events_format"] = "msgpack" if HAS_MSGSPEC else "jsonl.gz"
 
         self._record_event("session_completed", data=result_data)
 
         # Save metadata
-        meta_path = self.session_dir / "metadata.json"
-        with open(meta_path, "w") as f:
-            json.dump(self._metadata, f, indent=2, default=str)
+        with open(self._meta_path, "wb") as f:
+            f.write(_dumps_pretty(self._metadata))
 
-        # Save events as JSONL for streaming replay
-        events_path = self.session_dir / "events.jsonl"
-        with open(events_path, "w") as f:
-            for event in self.events:
-                f.write(json.dumps(event.to_dict(), default=str) + "\n")
+        # Write out any events the incremental flushes haven't covered yet
+        self.flush()
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
 
         return str(self.session_dir)
 
+    def flush(self) -> None:
+        """Write all unflushed events out, synchronously."""
+        if self._last_write is not None:
+            self._last_write.result()
+            self._last_write = None
+        pending = self.events[self._flushed :]
+        if not pending:
+            return
+        self._flushed = len(self.events)
+        self._write_batch(pending)
+
+    def _flush_in_background(self) -> None:
+        """Hand the current batch to the writer thread and return immediately."""
+        pending = self.events[self._flushed :]
+        if not pending:
+            return
+        self._flushed = len(self.events)
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-io")
+        self._last_write = self._io_pool.submit(self._write_batch, pending)
+
+    def _write_batch(self, pending: list[dict[str, Any]]) -> None:
+        """Append one batch of events to the events file."""
+        if not self._dir_ready:
+            self.session_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+        if HAS_MSGSPEC:
+            # Length-prefixed msgpack frames: self-delimiting, so batches
+            # can be appended without re-reading earlier ones. enc_hook
+            # stringifies oddball values like the JSON paths' default=str,
+            # so one weird tool input can't crash the writer thread.
+            encode = _msgpack.Encoder(enc_hook=str).encode
+            buf = bytearray()
+            for event in pending:
+                frame = encode(event)
+                buf += len(frame).to_bytes(4, "little")
+                buf += frame
+            with open(self._events_path, "ab") as f:
+                f.write(buf)
+        else:
+            # JSONL compresses 3-5x (repeated event_type/agent_id keys);
+            # each append-mode flush adds a gzip member, which gzip reads
+            # back transparently as one stream.
+            with gzip.open(self._events_path, "ab", compresslevel=1) as f:
+                f.writelines(_dumps_jsonl(event) for event in pending)
+
     def _record_event(
         self,
         event_type: str,
@@ -143,65 +255,114 @@ class SessionRecorder:
         task_id: str | None = None,
         data: dict[str, Any] | None = None,
     ) -> None:
-        event = SessionEvent(
-            timestamp=time.time() - self.start_time,
-            event_type=event_type,
-            agent_id=agent_id,
-            task_id=task_id,
-            data=data or {},
+        self.events.append(
+            {
+                "timestamp_ms": (time.perf_counter_ns() - self._start_ns) // 1_000_000,
+                # Event types repeat across thousands of events; interning
+                # shares one allocation per distinct string.
+                "event_type": sys.intern(event_type),
+                "agent_id": agent_id,
+                "task_id": task_id,
+                "data": data or {},
+            }
         )
-        self.events.append(event)
+        if len(self.events) - self._flushed >= _FLUSH_BATCH:
+            self._flush_in_background()
 
 
 def list_sessions(limit: int = 20) -> list[dict[str, Any]]:
-    """List recent sessions."""
+    """List recent sessions, newest first."""
     if not SESSIONS_DIR.exists():
         return []
 
+    # Select the newest `limit` directories by mtime before touching any
+    # metadata — scandir stats entries in one pass and nlargest avoids
+    # sorting the whole store, so only the selected few get parsed.
+    with os.scandir(SESSIONS_DIR) as entries:
+        candidates = [
+            (entry.stat().st_mtime, entry.name, entry.path)
+            for entry in entries
+            if entry.is_dir()
+        ]
+
     sessions = []
-    for session_dir in sorted(SESSIONS_DIR.iterdir(), reverse=True):
-        if not session_dir.is_dir():
+    for _, name, path in heapq.nlargest(limit, candidates):
+        meta_path = Path(path) / "metadata.json"
+        try:
+            meta = _loads(meta_path.read_bytes())
+        except FileNotFoundError:
             continue
-        meta_path = session_dir / "metadata.json"
-        if meta_path.exists():
-            with open(meta_path) as f:
-                meta = json.load(f)
-            sessions.append(
-                {
-                    "session_id": meta.get("session_id", session_dir.name),
-                    "prompt": meta.get("prompt", "")[:80],
-                    "start_time": meta.get("start_time"),
-                    "duration_s": meta.get("duration_s"),
-                    "result": meta.get("result", {}),
-                }
-            )
-        if len(sessions) >= limit:
-            break
+        sessions.append(
+            {
+                "session_id": meta.get("session_id", name),
+                "prompt": meta.get("prompt", "")[:80],
+                "start_time": meta.get("start_time"),
+                "duration_s": meta.get("duration_s"),
+                "result": meta.get("result", {}),
+            }
+        )
 
     return sessions
 
 
 def load_session_events(session_id: str) -> list[dict[str, Any]]:
     """Load events from a session for replay."""
-    events_path = SESSIONS_DIR / session_id / "events.jsonl"
-    if not events_path.exists():
+    session_dir = SESSIONS_DIR / session_id
+
+    msgpack_path = session_dir / "events.msgpack"
+    if msgpack_path.exists():
+        if not HAS_MSGSPEC:
+            raise ImportError(
+                f"Session {session_id} was recorded as msgpack and needs msgspec"
+                " to replay. Install with: pip install msgspec"
+            )
+        return _load_msgpack_events(msgpack_path)
+
+    gz_path = session_dir / "events.jsonl.gz"
+    if gz_path.exists():
+        events = []
+        with gzip.open(gz_path, "rb") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    events.append(_loads(line))
+        return events
+
+    # Legacy uncompressed sessions: mmap and split lines in-place rather
+    # than paying a buffered readline per event.
+    events_path = session_dir / "events.jsonl"
+    if not events_path.exists() or events_path.stat().st_size == 0:
         return []
 
+    with open(events_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Split the whole mapping on newlines in C rather than paying
+            # a readline call per event.
+            return [_loads(line) for line in bytes(mm).split(b"\n") if line]
+
+
+def _load_msgpack_events(path: Path) -> list[dict[str, Any]]:
+    """Decode a file of length-prefixed msgpack event frames."""
+    data = path.read_bytes()
+    decode = _msgpack.Decoder().decode
     events = []
-    with open(events_path) as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                events.append(json.loads(line))
+    pos = 0
+    end = len(data)
+    while pos + 4 <= end:
+        size = int.from_bytes(data[pos : pos + 4], "little")
+        pos += 4
+        events.append(decode(data[pos : pos + size]))
+        pos += size
     return events
 
 
 def _truncate_input(tool_input: dict[str, Any], max_len: int = 200) -> dict[str, Any]:
     """Truncate long tool input values for storage."""
-    truncated = {}
-    for key, value in tool_input.items():
-        if isinstance(value, str) and len(value) > max_len:
-            truncated[key] = value[:max_len] + "..."
-        else:
-            truncated[key] = value
-    return truncated
+    # Fast path: most tool inputs (file paths, small args) need no
+    # truncation, so skip the copy entirely.
+    if all(type(value) is not str or len(value) <= max_len for value in tool_input.values()):
+        return tool_input
+    return {
+        key: value[:max_len] + "..." if type(value) is str and len(value) > max_len else value
+        for key, value in tool_input.items()
+    }
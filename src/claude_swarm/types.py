@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any
@@ -28,7 +30,7 @@ class AgentStatus(StrEnum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class SwarmTask:
     """A single task in the swarm's dependency graph."""
 
@@ -43,13 +45,40 @@ class SwarmTask:
     error: str | None = None
     cost_usd: float = 0.0
     duration_ms: int = 0
-    tools: list[str] = field(default_factory=list)
+    tools: list[str] | tuple[str, ...] = field(default_factory=list)
     prompt: str = ""
+    # Dashboard display string, precomputed since descriptions are
+    # immutable — saves a slice per task per rendered frame.
+    short_description: str = field(default="", init=False, repr=False, compare=False)
+    # Frozen at construction so readiness checks against a completed set
+    # reuse one C-level subset compare instead of rebuilding a set per poll.
+    _deps_fs: frozenset[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # agent_type is drawn from a handful of values ("coder",
+        # "reviewer", ...) repeated across every task; interning
+        # deduplicates the allocations and makes == a pointer compare.
+        # Task ids get the same treatment — they key every scheduler dict
+        # and appear in sibling dependency lists, so interned ids make
+        # those lookups pointer-identity hits.
+        self.agent_type = sys.intern(self.agent_type)
+        self.id = sys.intern(self.id)
+        # dict.fromkeys dedupes while preserving order — a duplicated dep
+        # would inflate in-degree counts and under-schedule the layering.
+        self.dependencies = [sys.intern(dep) for dep in dict.fromkeys(self.dependencies)]
+        self.short_description = (
+            self.description if len(self.description) <= 50 else self.description[:47] + "..."
+        )
+        self._deps_fs = frozenset(self.dependencies)
 
     @property
     def is_ready(self) -> bool:
         """Check if all dependencies are completed."""
-        return self.status == TaskStatus.PENDING and len(self.dependencies) == 0
+        return self.status is TaskStatus.PENDING and len(self.dependencies) == 0
+
+    def is_unblocked_by(self, completed: frozenset[str]) -> bool:
+        """Check if every dependency appears in the given completed set."""
+        return self.status is TaskStatus.PENDING and self._deps_fs <= completed
 
     def to_agent_definition_dict(self) -> dict[str, Any]:
         """Convert to a dict suitable for AgentDefinition kwargs."""
@@ -61,7 +90,7 @@ class SwarmTask:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SwarmAgent:
     """A running agent in the swarm."""
 
@@ -71,11 +100,13 @@ class SwarmAgent:
     status: AgentStatus = AgentStatus.IDLE
     cost_usd: float = 0.0
     turns: int = 0
-    files_modified: list[str] = field(default_factory=list)
+    # Insertion-ordered with O(1) membership (a coder touching many files
+    # would make list membership checks quadratic)
+    files_modified: dict[str, None] = field(default_factory=dict)
     current_tool: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FileConflict:
     """Detected when multiple agents try to modify the same file."""
 
@@ -85,7 +116,7 @@ class FileConflict:
     resolved: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SwarmPlan:
     """The decomposed plan for a complex task."""
 
@@ -93,35 +124,134 @@ class SwarmPlan:
     tasks: list[SwarmTask]
     estimated_total_cost: float = 0.0
     model_used: str = "opus"
+    # Hand-rolled cache slot: cached_property needs a __dict__, which
+    # slots=True removes.
+    _parallel_groups: tuple[tuple[str, ...], ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _dependents: dict[str, list[str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_edge_list(
+        cls,
+        *,
+        ids: Sequence[str],
+        descriptions: Sequence[str],
+        agent_types: Sequence[str],
+        edges: Sequence[tuple[str, str]] = (),
+        original_prompt: str = "",
+    ) -> SwarmPlan:
+        """Build a plan from parallel field sequences in one pass.
+
+        Edges are (dependency, dependent) pairs; each dependent's
+        dependency list is assembled once here instead of callers
+        regrouping edges per task. An edge naming an unknown task id
+        raises KeyError.
+        """
+        deps: dict[str, list[str]] = {task_id: [] for task_id in ids}
+        for dep, dependent in edges:
+            if dep not in deps:
+                raise KeyError(dep)
+            deps[dependent].append(dep)
+        tasks = [
+            SwarmTask(id=task_id, description=desc, agent_type=atype, dependencies=deps[task_id])
+            for task_id, desc, atype in zip(ids, descriptions, agent_types, strict=True)
+        ]
+        return cls(original_prompt=original_prompt, tasks=tasks)
 
     @property
     def task_count(self) -> int:
         return len(self.tasks)
 
     @property
-    def parallel_groups(self) -> list[list[str]]:
-        """Group tasks by dependency level for parallel execution."""
-        # Tasks with no dependencies can run first
-        remaining = {t.id: set(t.dependencies) for t in self.tasks}
-        groups: list[list[str]] = []
-
-        while remaining:
-            # Find all tasks whose dependencies are satisfied
-            ready = [tid for tid, deps in remaining.items() if len(deps) == 0]
-            if not ready:
-                # Circular dependency — shouldn't happen with good decomposition
-                ready = list(remaining.keys())[:1]
-            groups.append(ready)
+    def dependents(self) -> dict[str, list[str]]:
+        """Reverse dependency graph: task id -> ids of tasks depending on it.
+
+        Built once and shared by parallel_groups and the orchestrator's
+        scheduler, so neither rebuilds the adjacency per use.
+        """
+        if self._dependents is None:
+            children: dict[str, list[str]] = {}
+            for t in self.tasks:
+                for dep in t.dependencies:
+                    children.setdefault(dep, []).append(t.id)
+            self._dependents = children
+        return self._dependents
+
+    @property
+    def parallel_groups(self) -> tuple[tuple[str, ...], ...]:
+        """Group tasks by dependency level for parallel execution.
+
+        Cached on first access — the task list is fixed once a plan is
+        built, and both the demo and UI iterate the grouping repeatedly.
+        Tuples rather than lists, so the cached result can be shared and
+        hashed without defensive copies.
+        """
+        if self._parallel_groups is None:
+            self._parallel_groups = tuple(self.iter_parallel_groups())
+        return self._parallel_groups
+
+    def iter_parallel_groups(self) -> Iterator[tuple[str, ...]]:
+        """Yield dependency layers one at a time, computed lazily.
+
+        Uses Kahn's algorithm: each task is visited once and each edge
+        decremented once (O(V+E)), instead of rescanning every remaining
+        task's dependency set per level. Streaming consumers that stop
+        early (e.g. after a failed wave) never pay for the tail layers.
+
+        Ids within a layer are sorted, so the grouping is deterministic
+        for a given dependency graph regardless of task-list order.
+        """
+        if self._parallel_groups is not None:
+            yield from self._parallel_groups
+            return
+
+        # Fully independent plans (no edges at all) need no adjacency or
+        # in-degree bookkeeping: everything runs in one wave.
+        if self.tasks and not any(t.dependencies for t in self.tasks):
+            yield tuple(sorted(t.id for t in self.tasks))
+            return
+
+        indegree = {t.id: len(t.dependencies) for t in self.tasks}
+        children = self.dependents
+
+        ready = [tid for tid, n in indegree.items() if n == 0]
+        placed = 0
+
+        while ready:
+            yield tuple(sorted(ready))
+            placed += len(ready)
+            next_ready: list[str] = []
             for tid in ready:
-                del remaining[tid]
-            # Remove completed tasks from dependency lists
-            for deps in remaining.values():
-                deps -= set(ready)
+                for child in children.get(tid, ()):
+                    indegree[child] -= 1
+                    if indegree[child] == 0:
+                        next_ready.append(child)
+            ready = next_ready
+            if not ready and placed < len(indegree):
+                # Circular dependency — shouldn't happen with good
+                # decomposition; force-release one blocked task to make
+                # progress.
+                victim = next(tid for tid, n in indegree.items() if n > 0)
+                indegree[victim] = 0
+                ready = [victim]
+
+    def iter_scheduling_order(self) -> Iterator[SwarmTask]:
+        """Yield tasks layer by layer in dependency-resolution order.
 
-        return groups
+        Tasks within a layer keep their parallel_groups ordering; callers
+        that walk the plan in execution order (demo output, replay) get
+        each task exactly once without re-deriving the layering.
+        """
+        by_id = {t.id: t for t in self.tasks}
+        for group in self.parallel_groups:
+            for task_id in group:
+                yield by_id[task_id]
 
 
-@dataclass
+@dataclass(slots=True)
 class SwarmResult:
     """Final result of a swarm execution."""
 
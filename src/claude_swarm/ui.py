@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import time
+from collections import Counter
 from typing import Any
 
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.layout import Layout
 from rich.live import Live
 from rich.panel import Panel
@@ -17,6 +18,7 @@ from .types import (
     FileConflict,
     SwarmAgent,
     SwarmPlan,
+    SwarmTask,
     TaskStatus,
 )
 
@@ -38,6 +40,16 @@ AGENT_STATUS_STYLE = {
     AgentStatus.FAILED: ("red bold", "failed"),
 }
 
+# Shared immutable Text per status — both enums are closed, so a cell can
+# reuse one renderable instead of allocating a Text per row per refresh.
+# Never mutate these in place.
+TASK_STATUS_TEXT = {
+    status: Text(label, style=style) for status, (style, label) in TASK_STATUS_STYLE.items()
+}
+AGENT_STATUS_TEXT = {
+    status: Text(label, style=style) for status, (style, label) in AGENT_STATUS_STYLE.items()
+}
+
 
 class SwarmUI:
     """Rich terminal UI for displaying swarm progress."""
@@ -46,16 +58,54 @@ class SwarmUI:
         self.console = Console()
         self._live: Live | None = None
         self._start_time: float = 0.0
+        # Incremental dashboard state: the layout and tables persist
+        # across refreshes and only cells whose backing task/agent
+        # changed are rewritten, so a tick costs O(changes) instead of
+        # O(rows).
+        self._dash_layout: Layout | None = None
+        self._dash_plan: SwarmPlan | None = None
+        self._task_table: Table | None = None
+        self._agent_table: Table | None = None
+        self._task_rows: dict[str, int] = {}
+        self._task_snapshot: dict[str, tuple[TaskStatus, float]] = {}
+        # For plans taller than the terminal, render a sorted viewport of
+        # rows (running/failed pinned first) instead of every task.
+        self._windowed = False
+        self._task_window = 0
+        self._footer_key: tuple[tuple[str, bool], ...] | None = None
+        self._agent_rows: dict[str, int] = {}
+        self._agent_snapshot: dict[str, tuple[AgentStatus, str | None, int, float]] = {}
+        # Dependency/file strings are immutable once a plan is decomposed;
+        # join them once per task rather than on every print.
+        self._task_display: dict[str, tuple[str, str]] = {}
+        # Running status tallies, adjusted on each observed transition, so
+        # the header build is O(1) instead of three sweeps over the plan.
+        self._status_counts: dict[TaskStatus, int] = dict.fromkeys(TaskStatus, 0)
+        # Last fully-rendered plan display — the plan is immutable after
+        # decomposition, so a re-print reuses the renderable. Holds the
+        # plan itself: an is-check on a live reference can't collide the
+        # way an id() key can once the original plan is garbage-collected.
+        self._last_plan_render: tuple[SwarmPlan, Group] | None = None
 
     def print_plan(self, plan: SwarmPlan) -> None:
         """Display the decomposed plan before execution."""
+        cached = self._last_plan_render
+        if cached is not None and cached[0] is plan:
+            rendered = cached[1]
+        else:
+            rendered = self._render_plan(plan)
+            self._last_plan_render = (plan, rendered)
+
         self.console.print()
-        self.console.print(
-            Panel(
-                f"[bold]{plan.original_prompt}[/bold]",
-                title="[bold blue]Claude Swarm[/bold blue]",
-                subtitle=f"{plan.task_count} tasks | model: {plan.model_used}",
-            )
+        self.console.print(rendered)
+        self.console.print()
+
+    def _render_plan(self, plan: SwarmPlan) -> Group:
+        """Build the plan display renderable (panel, table, execution order)."""
+        panel = Panel(
+            f"[bold]{plan.original_prompt}[/bold]",
+            title="[bold blue]Claude Swarm[/bold blue]",
+            subtitle=f"{plan.task_count} tasks | model: {plan.model_used}",
         )
 
         # Task dependency table
@@ -67,24 +117,29 @@ class SwarmUI:
         table.add_column("Files", style="dim", width=30)
 
         for task in plan.tasks:
-            deps = ", ".join(task.dependencies) if task.dependencies else "-"
-            files = ", ".join(task.files_to_modify[:3]) if task.files_to_modify else "-"
-            if len(task.files_to_modify) > 3:
-                files += f" +{len(task.files_to_modify) - 3}"
+            deps, files = self._task_static_display(task)
             table.add_row(task.id, task.agent_type, task.description, deps, files)
 
-        self.console.print(table)
-
         # Parallel groups visualization
-        groups = plan.parallel_groups
-        self.console.print()
-        self.console.print("[bold]Execution Order:[/bold]")
-        for i, group in enumerate(groups):
+        waves: list[str] = ["", "[bold]Execution Order:[/bold]"]
+        for i, group in enumerate(plan.parallel_groups):
             prefix = "  " if i > 0 else ""
             tasks_str = " | ".join(f"[cyan]{tid}[/cyan]" for tid in group)
-            self.console.print(f"{prefix}Wave {i + 1}: [{tasks_str}]")
+            waves.append(f"{prefix}Wave {i + 1}: [{tasks_str}]")
 
-        self.console.print()
+        return Group(panel, table, *waves)
+
+    def _task_static_display(self, task: SwarmTask) -> tuple[str, str]:
+        """Return the cached (deps, files) display strings for a task."""
+        cached = self._task_display.get(task.id)
+        if cached is None:
+            deps = ", ".join(task.dependencies) if task.dependencies else "-"
+            files = ", ".join(task.files_to_modify[:3]) if task.files_to_modify else "-"
+            if len(task.files_to_modify) > 3:
+                files += f" +{len(task.files_to_modify) - 3}"
+            cached = (deps, files)
+            self._task_display[task.id] = cached
+        return cached
 
     def create_dashboard(
         self,
@@ -93,96 +148,210 @@ class SwarmUI:
         total_cost: float,
         conflicts: list[FileConflict],
     ) -> Layout:
-        """Create the live dashboard layout."""
+        """Create (or incrementally refresh) the live dashboard layout."""
+        if self._dash_layout is None or self._dash_plan is not plan:
+            self._build_dashboard(plan)
+        layout = self._dash_layout
+        assert layout is not None
+
+        self._sync_task_rows(plan)
+        self._sync_agent_rows(agents)
+
+        # Header
+        elapsed = time.monotonic() - self._start_time if self._start_time else 0
+        completed = self._status_counts[TaskStatus.COMPLETED]
+        running = self._status_counts[TaskStatus.RUNNING]
+        failed = self._status_counts[TaskStatus.FAILED]
+
+        # One markup parse instead of a Text plus six appends (each append
+        # grows the span list and builds a Style).
+        markup = (
+            f"[bold blue]Claude Swarm[/bold blue]  |  Tasks: {completed}/{plan.task_count} done"
+            f"  |  Running: {running}"
+            + (f"  |  [red]Failed: {failed}[/red]" if failed else "")
+            + f"  |  Cost: ${total_cost:.4f}  |  Time: {elapsed:.0f}s"
+        )
+        layout["header"].update(Panel(Text.from_markup(markup)))
+
+        # Footer: conflicts. Rebuilt only when the conflict set changes —
+        # in the steady state (no conflicts) this updates exactly once.
+        footer_key = tuple((c.file_path, c.resolved) for c in conflicts)
+        if footer_key != self._footer_key:
+            self._footer_key = footer_key
+            if conflicts:
+                unresolved = [c for c in conflicts if not c.resolved]
+                if unresolved:
+                    conflict_text = Text("FILE CONFLICTS: ", style="red bold")
+                    for c in unresolved[:3]:
+                        conflict_text.append(f"{c.file_path} ", style="yellow")
+                    layout["footer"].update(Panel(conflict_text))
+                else:
+                    layout["footer"].update(Panel(Text("No active conflicts", style="green")))
+            else:
+                layout["footer"].update(Panel(Text("No file conflicts detected", style="green")))
+
+        return layout
+
+    def _build_dashboard(self, plan: SwarmPlan) -> None:
+        """Construct the persistent layout and tables for a new plan."""
         layout = Layout()
         layout.split_column(
             Layout(name="header", size=3),
             Layout(name="body"),
             Layout(name="footer", size=3),
         )
-
-        # Header
-        elapsed = time.monotonic() - self._start_time if self._start_time else 0
-        completed = sum(1 for t in plan.tasks if t.status == TaskStatus.COMPLETED)
-        running = sum(1 for t in plan.tasks if t.status == TaskStatus.RUNNING)
-        failed = sum(1 for t in plan.tasks if t.status == TaskStatus.FAILED)
-
-        header_text = Text()
-        header_text.append("Claude Swarm", style="bold blue")
-        header_text.append(f"  |  Tasks: {completed}/{plan.task_count} done")
-        header_text.append(f"  |  Running: {running}")
-        if failed:
-            header_text.append(f"  |  Failed: {failed}", style="red")
-        header_text.append(f"  |  Cost: ${total_cost:.4f}")
-        header_text.append(f"  |  Time: {elapsed:.0f}s")
-
-        layout["header"].update(Panel(header_text))
-
-        # Body: split into tasks and agents
         layout["body"].split_row(
             Layout(name="tasks", ratio=3),
             Layout(name="agents", ratio=2),
         )
 
-        # Tasks table
         task_table = Table(title="Tasks", show_lines=False, expand=True)
         task_table.add_column("ID", style="cyan", width=10)
         task_table.add_column("Status", width=5)
         task_table.add_column("Type", style="magenta", width=10)
         task_table.add_column("Description")
         task_table.add_column("Cost", justify="right", width=8)
-
-        for task in plan.tasks:
-            style, indicator = TASK_STATUS_STYLE[task.status]
-            status_text = Text(indicator, style=style)
-            cost_str = f"${task.cost_usd:.3f}" if task.cost_usd > 0 else "-"
-            task_table.add_row(
-                task.id, status_text, task.agent_type, task.description[:50], cost_str
-            )
-
         layout["tasks"].update(Panel(task_table, title="[bold]Tasks[/bold]"))
 
-        # Agents table
         agent_table = Table(title="Agents", show_lines=False, expand=True)
         agent_table.add_column("Agent", style="cyan")
         agent_table.add_column("Status", width=8)
         agent_table.add_column("Tool", width=15)
         agent_table.add_column("Turns", justify="right", width=6)
         agent_table.add_column("Cost", justify="right", width=8)
+        layout["agents"].update(Panel(agent_table, title="[bold]Agents[/bold]"))
 
-        for agent in agents.values():
-            style, label = AGENT_STATUS_STYLE[agent.status]
-            status_text = Text(label, style=style)
-            tool = agent.current_tool or "-"
-            agent_table.add_row(
-                agent.name,
-                status_text,
-                tool,
-                str(agent.turns),
-                f"${agent.cost_usd:.3f}",
-            )
+        self._dash_layout = layout
+        self._dash_plan = plan
+        self._task_table = task_table
+        self._agent_table = agent_table
+        self._task_rows.clear()
+        self._task_snapshot.clear()
+        self._task_display.clear()
+        self._agent_rows.clear()
+        self._agent_snapshot.clear()
+        self._status_counts = dict.fromkeys(TaskStatus, 0)
+        self._footer_key = None
+
+        self._task_window = max(self.console.size.height - 10, 5)
+        self._windowed = len(plan.tasks) > self._task_window
 
-        layout["agents"].update(Panel(agent_table, title="[bold]Agents[/bold]"))
+        for task in plan.tasks:
+            self._task_snapshot[task.id] = (task.status, task.cost_usd)
+            self._status_counts[task.status] += 1
+            if not self._windowed:
+                cost_str = f"${task.cost_usd:.3f}" if task.cost_usd > 0 else "-"
+                self._task_rows[task.id] = task_table.row_count
+                task_table.add_row(
+                    task.id, TASK_STATUS_TEXT[task.status], task.agent_type,
+                    task.short_description, cost_str,
+                )
 
-        # Footer: conflicts
-        if conflicts:
-            unresolved = [c for c in conflicts if not c.resolved]
-            if unresolved:
-                conflict_text = Text("FILE CONFLICTS: ", style="red bold")
-                for c in unresolved[:3]:
-                    conflict_text.append(f"{c.file_path} ", style="yellow")
-                layout["footer"].update(Panel(conflict_text))
-            else:
-                layout["footer"].update(Panel(Text("No active conflicts", style="green")))
-        else:
-            layout["footer"].update(Panel(Text("No file conflicts detected", style="green")))
+        if self._windowed:
+            self._rebuild_task_window(plan)
 
-        return layout
+    def _sync_task_rows(self, plan: SwarmPlan) -> None:
+        """Rewrite only the status/cost cells of tasks that changed."""
+        table = self._task_table
+        assert table is not None
+        status_cells = table.columns[1]._cells
+        cost_cells = table.columns[4]._cells
+        changed = False
 
-    def start_live(self) -> Live:
-        """Start the live display."""
+        for task in plan.tasks:
+            snapshot = (task.status, task.cost_usd)
+            previous = self._task_snapshot.get(task.id)
+            if previous == snapshot:
+                continue
+            changed = True
+            if previous is not None and previous[0] is not task.status:
+                self._status_counts[previous[0]] -= 1
+                self._status_counts[task.status] += 1
+            self._task_snapshot[task.id] = snapshot
+            if self._windowed:
+                continue
+            row = self._task_rows[task.id]
+            status_cells[row] = TASK_STATUS_TEXT[task.status]
+            cost_cells[row] = f"${task.cost_usd:.3f}" if task.cost_usd > 0 else "-"
+
+        if self._windowed and changed:
+            self._rebuild_task_window(plan)
+
+    def _rebuild_task_window(self, plan: SwarmPlan) -> None:
+        """Re-fill the task table with the visible slice of a large plan.
+
+        Per-frame work stays bounded by terminal height: running tasks
+        first, then failures, then the rest in id order.
+        """
+        table = self._task_table
+        assert table is not None
+
+        visible = sorted(
+            plan.tasks,
+            key=lambda t: (
+                t.status is not TaskStatus.RUNNING,
+                t.status is not TaskStatus.FAILED,
+                t.id,
+            ),
+        )[: self._task_window]
+
+        table.rows.clear()
+        for column in table.columns:
+            column._cells.clear()
+        for task in visible:
+            cost_str = f"${task.cost_usd:.3f}" if task.cost_usd > 0 else "-"
+            table.add_row(
+                task.id, TASK_STATUS_TEXT[task.status], task.agent_type,
+                task.short_description, cost_str,
+            )
+        hidden = len(plan.tasks) - len(visible)
+        table.caption = f"... +{hidden} more tasks" if hidden else None
+
+    def _sync_agent_rows(self, agents: dict[str, SwarmAgent]) -> None:
+        """Append rows for new agents and rewrite cells for changed ones."""
+        table = self._agent_table
+        assert table is not None
+
+        for agent_id, agent in agents.items():
+            snapshot = (agent.status, agent.current_tool, agent.turns, agent.cost_usd)
+            if self._agent_snapshot.get(agent_id) == snapshot:
+                continue
+            self._agent_snapshot[agent_id] = snapshot
+
+            row = self._agent_rows.get(agent_id)
+            if row is None:
+                self._agent_rows[agent_id] = table.row_count
+                table.add_row(
+                    agent.name,
+                    AGENT_STATUS_TEXT[agent.status],
+                    agent.current_tool or "-",
+                    str(agent.turns),
+                    f"${agent.cost_usd:.3f}",
+                )
+                continue
+
+            columns = table.columns
+            columns[1]._cells[row] = AGENT_STATUS_TEXT[agent.status]
+            columns[2]._cells[row] = agent.current_tool or "-"
+            columns[3]._cells[row] = str(agent.turns)
+            columns[4]._cells[row] = f"${agent.cost_usd:.3f}"
+
+    def start_live(self, renderable: RenderableType | None = None) -> Live:
+        """Start the live display, optionally seeded with a stable renderable.
+
+        With the incrementally-updated dashboard the layout object never
+        changes identity, so Rich's auto-refresh thread can re-render the
+        mutated tables on its own timer without callers pushing frames.
+        """
         self._start_time = time.monotonic()
-        self._live = Live(console=self.console, refresh_per_second=4)
+        # Don't spin at full rate when output is piped to a file.
+        refresh = 8 if self.console.is_terminal else 1
+        self._live = Live(
+            renderable,
+            console=self.console,
+            refresh_per_second=refresh,
+            auto_refresh=True,
+        )
         self._live.start()
         return self._live
 
@@ -209,8 +378,9 @@ class SwarmUI:
             "fail": "bold red",
         }.get(report.verdict, "bold white")
 
-        self.console.print()
-        self.console.print(
+        # Compose the whole report and flush it with one console.print —
+        # each print call re-parses markup and emits ANSI separately.
+        parts: list[RenderableType] = [
             Panel(
                 f"[{score_style}]Score: {score}/10[/{score_style}]  |  "
                 f"[{verdict_style}]Verdict: {report.verdict.upper()}[/{verdict_style}]  |  "
@@ -218,17 +388,23 @@ class SwarmUI:
                 f"{report.summary}",
                 title="[bold magenta]Opus 4.6 Quality Gate[/bold magenta]",
             )
-        )
+        ]
 
         if report.integration_issues:
-            self.console.print("[yellow]Integration Issues:[/yellow]")
+            issues_text = Text("Integration Issues:", style="yellow")
             for issue in report.integration_issues:
-                self.console.print(f"  [yellow]![/yellow] {issue}")
+                issues_text.append("\n  ")
+                issues_text.append("!", style="yellow")
+                issues_text.append(f" {issue}", style="default")
+            parts.append(issues_text)
 
         if report.missing_items:
-            self.console.print("[red]Missing Items:[/red]")
+            missing_text = Text("Missing Items:", style="red")
             for item in report.missing_items:
-                self.console.print(f"  [red]-[/red] {item}")
+                missing_text.append("\n  ")
+                missing_text.append("-", style="red")
+                missing_text.append(f" {item}", style="default")
+            parts.append(missing_text)
 
         if report.task_reviews:
             review_table = Table(title="Per-Task Reviews", show_lines=True)
@@ -247,18 +423,19 @@ class SwarmUI:
                     suggestions[:60],
                 )
 
-            self.console.print(review_table)
+            parts.append(review_table)
 
-    def print_results(self, result: Any) -> None:
-        """Print final results summary."""
         self.console.print()
+        self.console.print(Group(*parts))
 
+    def print_results(self, result: Any) -> None:
+        """Print final results summary."""
         # Summary panel
         completed = len(result.completed_tasks)
         failed = len(result.failed_tasks)
-        cancelled = sum(
-            1 for t in result.plan.tasks if t.status == TaskStatus.CANCELLED
-        )
+        # One pass over the plan covers every status we might report.
+        counts = Counter(t.status for t in result.plan.tasks)
+        cancelled = counts[TaskStatus.CANCELLED]
         total = result.plan.task_count
         success_rate = (completed / total * 100) if total > 0 else 0
 
@@ -276,12 +453,16 @@ class SwarmUI:
         summary.add_row("Agents Used", str(result.agents_used))
         summary.add_row("File Conflicts", str(len(result.conflicts)))
 
-        self.console.print(summary)
+        parts: list[RenderableType] = [summary]
 
         if result.failed_tasks:
-            self.console.print()
-            self.console.print("[bold red]Failed Tasks:[/bold red]")
+            failed_text = Text("\nFailed Tasks:", style="bold red")
             for task in result.failed_tasks:
-                self.console.print(f"  [red]{task.id}[/red]: {task.error}")
+                failed_text.append("\n  ")
+                failed_text.append(task.id, style="red")
+                failed_text.append(f": {task.error}", style="default")
+            parts.append(failed_text)
 
         self.console.print()
+        self.console.print(Group(*parts))
+        self.console.print()
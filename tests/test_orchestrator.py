@@ -1,5 +1,12 @@
 """Tests for the SwarmOrchestrator (non-SDK-dependent logic)."""
 
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import patch
+
+import anyio
+from claude_agent_sdk.types import ResultMessage
+
 from claude_swarm.orchestrator import SwarmOrchestrator
 from claude_swarm.types import (
     AgentStatus,
@@ -14,6 +21,23 @@ def _make_plan(tasks: list[SwarmTask]) -> SwarmPlan:
     return SwarmPlan(original_prompt="test", tasks=tasks)
 
 
+def _fixed_cost_query(cost: float):
+    """A stub for claude_agent_sdk.query where every task costs `cost`."""
+
+    async def fake_query(*, prompt: str, options: Any) -> AsyncIterator[Any]:
+        yield ResultMessage(
+            subtype="success",
+            duration_ms=1,
+            duration_api_ms=1,
+            is_error=False,
+            num_turns=1,
+            session_id="stub",
+            total_cost_usd=cost,
+        )
+
+    return fake_query
+
+
 def test_get_ready_tasks_no_deps() -> None:
     tasks = [
         SwarmTask(id="a", description="A", agent_type="coder"),
@@ -72,14 +96,14 @@ def test_file_conflict_detection() -> None:
     ]
     orch = SwarmOrchestrator(plan=_make_plan(tasks), cwd="/tmp")
 
-    # Lock files for task a
-    agent_a = SwarmAgent(id="agent-a", name="coder-a", task_id="a", status=AgentStatus.WORKING)
-    orch.agents["agent-a"] = agent_a
-    orch._file_locks["src/auth.ts"] = "agent-a"
+    # Lock files for task a, as the scheduler does at dispatch
+    tasks[0].status = TaskStatus.RUNNING
+    orch._lock_files(tasks[0])
 
     conflict = orch._check_file_conflict(tasks[1])
     assert conflict is not None
     assert conflict.file_path == "src/auth.ts"
+    assert conflict.task_ids == ["a", "b"]
 
 
 def test_no_conflict_when_different_files() -> None:
@@ -88,15 +112,55 @@ def test_no_conflict_when_different_files() -> None:
         SwarmTask(id="b", description="B", agent_type="coder", files_to_modify=["src/user.ts"]),
     ]
     orch = SwarmOrchestrator(plan=_make_plan(tasks), cwd="/tmp")
-    orch._file_locks["src/auth.ts"] = "agent-a"
-    orch.agents["agent-a"] = SwarmAgent(
-        id="agent-a", name="coder-a", task_id="a", status=AgentStatus.WORKING
-    )
+    tasks[0].status = TaskStatus.RUNNING
+    orch._lock_files(tasks[0])
 
     conflict = orch._check_file_conflict(tasks[1])
     assert conflict is None
 
 
+def test_unlock_files_after_agent_assignment() -> None:
+    tasks = [
+        SwarmTask(id="a", description="A", agent_type="coder", files_to_modify=["src/auth.ts"]),
+    ]
+    orch = SwarmOrchestrator(plan=_make_plan(tasks), cwd="/tmp")
+
+    orch._lock_files(tasks[0])
+    assert "src/auth.ts" in orch._file_locks
+
+    # Execution assigns the agent after locking; release must still
+    # find the locks taken under the pre-assignment owner key.
+    tasks[0].assigned_agent = "agent-123"
+    tasks[0].status = TaskStatus.COMPLETED
+    orch._unlock_files(tasks[0])
+
+    assert orch._file_locks == {}
+    assert orch._task_files == {}
+
+
+def test_budget_exceeded_leaves_no_task_running() -> None:
+    tasks = [
+        SwarmTask(id=f"t{i}", description=f"Task {i}", agent_type="coder") for i in range(6)
+    ]
+    orch = SwarmOrchestrator(
+        plan=_make_plan(tasks), cwd="/tmp", max_concurrent=1, max_budget_usd=1.5
+    )
+
+    with patch("claude_swarm.orchestrator.query", _fixed_cost_query(1.0)):
+        result = anyio.run(orch.run)
+
+    # Every task must reach a terminal state — dispatched-but-unstarted
+    # tasks cancel themselves when they acquire a slot after the trip.
+    assert not any(t.status is TaskStatus.RUNNING for t in tasks)
+    cancelled = [t for t in tasks if t.status is TaskStatus.CANCELLED]
+    assert len(result.completed_tasks) + len(result.failed_tasks) + len(cancelled) == 6
+    assert cancelled and all(t.error for t in cancelled)
+    assert orch._all_done()
+    # Cancellation only fires on actual overspend: the first task leaves
+    # the budget intact, so the second still runs before the trip.
+    assert len(result.completed_tasks) == 2
+
+
 def test_cancel_pending_tasks() -> None:
     tasks = [
         SwarmTask(id="a", description="A", agent_type="coder", status=TaskStatus.COMPLETED),
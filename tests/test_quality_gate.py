@@ -53,6 +53,14 @@ def test_build_task_summaries() -> None:
     assert "auth.ts" in summaries
 
 
+def test_build_task_summaries_truncates_long_output() -> None:
+    result = _make_result()
+    result.plan.tasks[0].result = "x" * 50_000
+    summaries = _build_task_summaries(result)
+    assert "(truncated)" in summaries
+    assert len(summaries) < 50_000
+
+
 def test_parse_quality_report_valid_json() -> None:
     json_str = json.dumps({
         "overall_score": 8,
@@ -26,7 +26,10 @@ def test_session_recorder_lifecycle() -> None:
             session_dir = Path(tmpdir) / "test-session-001"
             assert session_dir.exists()
             assert (session_dir / "metadata.json").exists()
-            assert (session_dir / "events.jsonl").exists()
+            assert any(
+                (session_dir / name).exists()
+                for name in ("events.jsonl.gz", "events.msgpack", "events.jsonl")
+            )
 
             # Verify metadata
             with open(session_dir / "metadata.json") as f:
@@ -1,5 +1,7 @@
 """Tests for core type definitions."""
 
+import pytest
+
 from claude_swarm.types import SwarmPlan, SwarmTask, TaskStatus
 
 
@@ -25,6 +27,28 @@ def test_swarm_task_not_ready_with_deps() -> None:
     assert task.is_ready is False
 
 
+def test_swarm_task_dependencies_deduplicated() -> None:
+    task = SwarmTask(
+        id="task-3",
+        description="Test task",
+        agent_type="coder",
+        dependencies=["a", "a", "b"],
+    )
+    assert task.dependencies == ["a", "b"]
+
+
+def test_swarm_task_unblocked_by_completed_set() -> None:
+    task = SwarmTask(
+        id="task-2",
+        description="Test task",
+        agent_type="coder",
+        status=TaskStatus.PENDING,
+        dependencies=["task-1"],
+    )
+    assert task.is_unblocked_by(frozenset()) is False
+    assert task.is_unblocked_by(frozenset({"task-1"})) is True
+
+
 def test_swarm_task_not_ready_if_running() -> None:
     task = SwarmTask(
         id="task-1",
@@ -46,8 +70,33 @@ def test_swarm_plan_parallel_groups() -> None:
 
     groups = plan.parallel_groups
     assert len(groups) == 2
-    assert set(groups[0]) == {"a", "b"}
-    assert groups[1] == ["c"]
+    assert groups[0] == ("a", "b")
+    assert groups[1] == ("c",)
+
+
+def test_swarm_plan_dependents() -> None:
+    tasks = [
+        SwarmTask(id="a", description="A", agent_type="coder", dependencies=[]),
+        SwarmTask(id="b", description="B", agent_type="coder", dependencies=[]),
+        SwarmTask(id="c", description="C", agent_type="reviewer", dependencies=["a", "b"]),
+    ]
+    plan = SwarmPlan(original_prompt="test", tasks=tasks)
+
+    assert plan.dependents["a"] == ["c"]
+    assert plan.dependents["b"] == ["c"]
+    assert "c" not in plan.dependents
+
+
+def test_swarm_plan_iter_parallel_groups_is_lazy() -> None:
+    tasks = [
+        SwarmTask(id="a", description="A", agent_type="coder", dependencies=[]),
+        SwarmTask(id="b", description="B", agent_type="coder", dependencies=["a"]),
+    ]
+    plan = SwarmPlan(original_prompt="test", tasks=tasks)
+
+    groups = plan.iter_parallel_groups()
+    assert next(groups) == ("a",)
+    assert next(groups) == ("b",)
 
 
 def test_swarm_plan_task_count() -> None:
@@ -59,6 +108,30 @@ def test_swarm_plan_task_count() -> None:
     assert plan.task_count == 2
 
 
+def test_swarm_plan_from_edge_list() -> None:
+    n = 1000
+    ids = [f"t{i}" for i in range(n)]
+    plan = SwarmPlan.from_edge_list(
+        ids=ids,
+        descriptions=[f"Task {i}" for i in range(n)],
+        agent_types=["coder"] * n,
+        edges=[(f"t{i}", f"t{i + 1}") for i in range(n - 1)],
+        original_prompt="big chain",
+    )
+
+    assert plan.task_count == n
+    assert len(plan.parallel_groups) == n
+    assert plan.parallel_groups[0] == ("t0",)
+
+
+def test_swarm_plan_from_edge_list_rejects_unknown_edge_ids() -> None:
+    kwargs = dict(ids=["a", "b"], descriptions=["A", "B"], agent_types=["coder", "coder"])
+    with pytest.raises(KeyError):
+        SwarmPlan.from_edge_list(**kwargs, edges=[("missing", "b")])
+    with pytest.raises(KeyError):
+        SwarmPlan.from_edge_list(**kwargs, edges=[("a", "missing")])
+
+
 def test_swarm_plan_serial_dependencies() -> None:
     tasks = [
         SwarmTask(id="a", description="A", agent_type="coder", dependencies=[]),
@@ -69,6 +142,6 @@ def test_swarm_plan_serial_dependencies() -> None:
 
     groups = plan.parallel_groups
     assert len(groups) == 3
-    assert groups[0] == ["a"]
-    assert groups[1] == ["b"]
-    assert groups[2] == ["c"]
+    assert groups[0] == ("a",)
+    assert groups[1] == ("b",)
+    assert groups[2] == ("c",)